@@ -17,7 +17,7 @@ import json
 import re
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import click
 from rich.console import Console
@@ -30,7 +30,7 @@ from ..packages import load_monorepo, find_monorepo_root
 console = Console()
 
 
-def _get_affected_packages(file_paths: list[str]) -> list[str]:
+def _get_affected_packages(file_paths: Iterable[str]) -> list[str]:
     """Determine which packages are affected by a list of file paths.
 
     This is a shared utility extracted from workflows.py so that
@@ -40,13 +40,16 @@ def _get_affected_packages(file_paths: list[str]) -> list[str]:
     """
     packages = set()
     for filepath in file_paths:
-        parts = Path(filepath).parts
-        if len(parts) >= 2 and parts[0] == "packages":
+        # Git reports repo-relative paths with "/" separators; only the
+        # first two components matter, so avoid building a Path per file.
+        # Untracked directories carry a trailing "/".
+        parts = filepath.rstrip("/").split("/", 2)
+        if len(parts) == 1:
+            packages.add("root")
+        elif parts[0] == "packages":
             packages.add(parts[1])
-        elif len(parts) >= 2 and parts[0] == "tools":
+        elif parts[0] == "tools":
             packages.add(f"tools/{parts[1]}")
-        elif len(parts) == 1:
-            packages.add("root")
     return sorted(packages)
 
 
@@ -9,7 +9,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
-from rich.markdown import Markdown
 
 from ...gh_wrapper import GitHub, GitHubError
 from ...ui import is_interactive
@@ -206,6 +205,8 @@ def issue_view(
 
         # Body
         if issue.body:
+            from rich.markdown import Markdown
+
             console.print("\n[bold]Description:[/bold]")
             console.print(Markdown(issue.body))
 
@@ -7,9 +7,7 @@ import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
-from rich.syntax import Syntax
 from rich.table import Table
-from rich.markdown import Markdown
 
 from ...gh_wrapper import GitHub, GitHubError, PRComment, PRCheck
 from ...ui import is_interactive
@@ -184,6 +182,8 @@ def pr_view(
 
         # Body
         if pr.body:
+            from rich.markdown import Markdown
+
             console.print("\n[bold]Description:[/bold]")
             console.print(Markdown(pr.body))
 
@@ -589,6 +589,8 @@ def pr_comments(
             )
         )
 
+        from rich.markdown import Markdown
+
         for c in comments:
             # Header with author and time
             comment_type = "[dim](review)[/dim] " if c.is_review_comment else ""
@@ -764,6 +766,8 @@ def pr_diff(
             return
 
         # Syntax highlight the diff
+        from rich.syntax import Syntax
+
         console.print(Syntax(diff, "diff", theme="monokai", line_numbers=False))
 
     except GitHubError as e:
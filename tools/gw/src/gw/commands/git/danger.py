@@ -10,7 +10,7 @@ from rich.prompt import Confirm, Prompt
 
 from ...git_wrapper import Git, GitError
 from ...safety.git import (
-    GitSafetyConfig,
+    DEFAULT_GIT_SAFETY_CONFIG,
     GitSafetyError,
     check_git_safety,
     is_agent_mode,
@@ -346,7 +346,7 @@ def merge(
         current_branch = git.current_branch()
 
         # Check if merging into protected branch in agent mode
-        config = GitSafetyConfig()
+        config = DEFAULT_GIT_SAFETY_CONFIG
         if is_agent_mode() and is_protected_branch(current_branch, config):
             console.print(
                 f"[red]Cannot merge into protected branch '{current_branch}' in agent mode[/red]"
@@ -1,20 +1,40 @@
 """Read-only Git commands (Tier 1 - Always Safe)."""
 
-import json
 import re
+import sys
 from typing import Optional
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.text import Text
 
 from ...git_wrapper import Git, GitError
+from ...json_output import print_json
 
 console = Console()
 
+# Past this size Pygments tokenization dominates; print the text as-is
+_SYNTAX_MAX_CHARS = 1_000_000
+
+# Status letter → label for the rich status tables
+_STAGED_NAMES = {
+    "M": "modified",
+    "A": "added",
+    "D": "deleted",
+    "R": "renamed",
+    "C": "copied",
+}
+_UNSTAGED_NAMES = {
+    "M": "modified",
+    "D": "deleted",
+    "U": "conflict",
+}
+
+# blame --line START-END
+_LINE_RANGE = re.compile(r"(\d+)-(\d+)")
+
+# git-style "-N" count shorthand (e.g. "-5" for "-n 5")
+_NUMERIC_SHORTHAND = re.compile(r"-\d+")
+
 
 class NumericShorthandCommand(click.Command):
     """Click command that supports git-style -N shorthand for -n N."""
@@ -22,16 +42,33 @@ class NumericShorthandCommand(click.Command):
     def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
         new_args = []
         for arg in args:
-            if re.match(r"^-\d+$", arg):
+            # Cheap prefix test first — most tokens are not "-N" shorthand
+            if arg[:1] == "-" and _NUMERIC_SHORTHAND.fullmatch(arg):
                 new_args.extend(["-n", arg[1:]])
             else:
                 new_args.append(arg)
         return super().parse_args(ctx, new_args)
 
 
+def _print_syntax(output: str, lexer: str) -> None:
+    """Print git output, syntax-highlighted only when it will be seen.
+
+    Highlighting is skipped when stdout is not a terminal (pipes, files,
+    CI logs) and for very large outputs.
+    """
+    if not console.is_terminal or len(output) > _SYNTAX_MAX_CHARS:
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        return
+
+    from rich.syntax import Syntax
+
+    console.print(Syntax(output, lexer, theme="monokai", line_numbers=False))
+
+
 @click.command()
 @click.option("--short", "-s", is_flag=True, help="Show short format")
-@click.option("--porcelain", is_flag=True, help="Machine-readable output")
+@click.option("--porcelain", is_flag=True, help="Raw git porcelain v2 output (NUL-delimited)")
 @click.pass_context
 def status(ctx: click.Context, short: bool, porcelain: bool) -> None:
     """Show working tree status.
@@ -42,7 +79,8 @@ def status(ctx: click.Context, short: bool, porcelain: bool) -> None:
     Examples:
         gw git status           # Rich formatted status
         gw git status --short   # Compact output
-        gw git status --porcelain  # Machine-readable
+        gw git status --porcelain  # git's porcelain v2 -z format
+        gw git --json status    # Structured JSON
     """
     output_json = ctx.obj.get("output_json", False)
 
@@ -53,9 +91,16 @@ def status(ctx: click.Context, short: bool, porcelain: bool) -> None:
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
+        # Porcelain consumers get git's own bytes, unparsed
+        if porcelain and not output_json:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(git.status_porcelain_raw())
+            sys.stdout.buffer.flush()
+            return
+
         git_status = git.status()
 
-        if output_json or porcelain:
+        if output_json:
             data = {
                 "branch": git_status.branch,
                 "upstream": git_status.upstream,
@@ -67,7 +112,7 @@ def status(ctx: click.Context, short: bool, porcelain: bool) -> None:
                 "unstaged": [{"status": s, "path": p} for s, p in git_status.unstaged],
                 "untracked": git_status.untracked,
             }
-            console.print(json.dumps(data, indent=2))
+            print_json(data)
             return
 
         if short:
@@ -107,6 +152,10 @@ def _print_short_status(status) -> None:
 
 def _print_rich_status(status) -> None:
     """Print Rich formatted status."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     # Branch panel
     branch_text = Text()
     branch_text.append("On branch ", style="dim")
@@ -140,16 +189,8 @@ def _print_rich_status(status) -> None:
         table.add_column("Status", style="green", width=8)
         table.add_column("File")
 
-        status_names = {
-            "M": "modified",
-            "A": "added",
-            "D": "deleted",
-            "R": "renamed",
-            "C": "copied",
-        }
-
         for s, path in status.staged:
-            table.add_row(status_names.get(s, s), path)
+            table.add_row(_STAGED_NAMES.get(s, s), path)
 
         console.print(table)
 
@@ -159,14 +200,8 @@ def _print_rich_status(status) -> None:
         table.add_column("Status", style="yellow", width=8)
         table.add_column("File")
 
-        status_names = {
-            "M": "modified",
-            "D": "deleted",
-            "U": "conflict",
-        }
-
         for s, path in status.unstaged:
-            table.add_row(status_names.get(s, s), path)
+            table.add_row(_UNSTAGED_NAMES.get(s, s), path)
 
         console.print(table)
 
@@ -230,8 +265,7 @@ def log(
                 args.extend(["--", file_path])
             output = git.execute(args)
             if output.strip():
-                syntax = Syntax(output, "text", theme="monokai", line_numbers=False)
-                console.print(syntax)
+                _print_syntax(output, "text")
             else:
                 console.print("[dim]No commits[/dim]")
             return
@@ -256,27 +290,35 @@ def log(
                 }
                 for c in commits
             ]
-            console.print(json.dumps(data, indent=2))
+            print_json(data)
+            return
+
+        if not commits:
             return
 
+        # Build one pre-styled Text so rendering involves no markup parsing
+        # (and commit subjects containing "[...]" are printed verbatim)
+        from rich.text import Text
+
+        text = Text()
         if oneline:
             for commit in commits:
-                console.print(
-                    f"[yellow]{commit.short_hash}[/yellow] {commit.subject}"
-                )
+                text.append(commit.short_hash, style="yellow")
+                text.append(f" {commit.subject}\n")
         else:
             for commit in commits:
-                console.print(
-                    f"[yellow]commit {commit.hash}[/yellow]"
+                text.append(f"commit {commit.hash}", style="yellow")
+                text.append(
+                    f"\nAuthor: {commit.author} <{commit.author_email}>\n"
+                    f"Date:   {commit.date}\n\n"
+                    f"    {commit.subject}\n"
                 )
-                console.print(f"Author: {commit.author} <{commit.author_email}>")
-                console.print(f"Date:   {commit.date}")
-                console.print()
-                console.print(f"    {commit.subject}")
                 if commit.body:
                     for line in commit.body.strip().split("\n"):
-                        console.print(f"    {line}")
-                console.print()
+                        text.append(f"    {line}\n")
+                text.append("\n")
+        text.right_crop(1)  # console.print supplies the final newline
+        console.print(text)
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
@@ -325,9 +367,8 @@ def diff(
         if separator_seen:
             # Everything after -- is a path
             file_path = arg
-        elif file_path is None and (arg.startswith("/") or arg.startswith(".")
-                                    or arg.endswith("/") or "/" in arg):
-            # Looks like a path (contains slashes, starts with . or /)
+        elif file_path is None and ("/" in arg or arg[:1] == "."):
+            # Looks like a path (contains a slash or starts with .)
             file_path = arg
         else:
             ref = arg
@@ -352,7 +393,7 @@ def diff(
                 "files": git_diff.files,
                 "stats": git_diff.stats,
             }
-            console.print(json.dumps(data, indent=2))
+            print_json(data)
             return
 
         if stat_only or not git_diff.raw:
@@ -361,6 +402,8 @@ def diff(
                 console.print("[dim]No changes[/dim]")
                 return
 
+            from rich.table import Table
+
             table = Table(border_style="green")
             table.add_column("File")
             table.add_column("Additions", style="green", justify="right")
@@ -381,13 +424,7 @@ def diff(
             )
         else:
             # Show full diff with syntax highlighting
-            syntax = Syntax(
-                git_diff.raw,
-                "diff",
-                theme="monokai",
-                line_numbers=False,
-            )
-            console.print(syntax)
+            _print_syntax(git_diff.raw, "diff")
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
@@ -415,6 +452,17 @@ def blame(ctx: click.Context, file_path: str, line_range: Optional[str]) -> None
     """
     output_json = ctx.obj.get("output_json", False)
 
+    line_start = None
+    line_end = None
+
+    if line_range:
+        match = _LINE_RANGE.fullmatch(line_range)
+        if not match:
+            console.print(f"[red]Invalid line range:[/red] {line_range}")
+            console.print("[dim]Use START-END, e.g. --line 50-75[/dim]")
+            raise SystemExit(1)
+        line_start, line_end = int(match[1]), int(match[2])
+
     try:
         git = Git()
 
@@ -422,15 +470,6 @@ def blame(ctx: click.Context, file_path: str, line_range: Optional[str]) -> None
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
-        line_start = None
-        line_end = None
-
-        if line_range:
-            parts = line_range.split("-")
-            if len(parts) == 2:
-                line_start = int(parts[0])
-                line_end = int(parts[1])
-
         output = git.blame(file_path, line_start, line_end)
 
         if output_json:
@@ -438,12 +477,11 @@ def blame(ctx: click.Context, file_path: str, line_range: Optional[str]) -> None
             lines = []
             for line in output.strip().split("\n"):
                 lines.append({"raw": line})
-            console.print(json.dumps({"lines": lines}, indent=2))
+            print_json({"lines": lines})
             return
 
         # Show blame output with syntax highlighting
-        syntax = Syntax(output, "text", theme="monokai", line_numbers=False)
-        console.print(syntax)
+        _print_syntax(output, "text")
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
@@ -478,12 +516,11 @@ def show(ctx: click.Context, ref: str, stat_only: bool) -> None:
         output = git.show(ref, stat_only)
 
         if output_json:
-            console.print(json.dumps({"output": output}, indent=2))
+            print_json({"output": output})
             return
 
         # Show with syntax highlighting
-        syntax = Syntax(output, "diff", theme="monokai", line_numbers=False)
-        console.print(syntax)
+        _print_syntax(output, "diff")
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
@@ -549,7 +586,7 @@ def fetch(
                 "remote": "all" if all_remotes else remote,
                 "pruned": prune,
             }
-            console.print(json.dumps(data))
+            print_json(data, indent=False)
         else:
             target = "all remotes" if all_remotes else remote
             if branch:
@@ -559,7 +596,16 @@ def fetch(
                 console.print("[dim]Pruned stale remote-tracking branches[/dim]")
 
     except GitError as e:
-        console.print(f"[red]Git error:[/red] {e.message}")
+        # A configured remote with a bad URL fails with the same message,
+        # so only report names that are not configured remotes
+        if (
+            not all_remotes
+            and "does not appear to be a git repository" in e.stderr
+            and remote not in git.remotes()
+        ):
+            console.print(f"[red]No such remote:[/red] {remote}")
+        else:
+            console.print(f"[red]Git error:[/red] {e.message}")
         raise SystemExit(1)
 
 
@@ -587,52 +633,42 @@ def reflog(ctx: click.Context, limit: int) -> None:
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
+        # Fields are separated by the ASCII unit separator so each entry
+        # parses with a single split, regardless of spaces in the action.
         output = git.execute([
             "reflog", "show",
             f"-{limit}",
-            "--format=%h %gd %gs (%cr)",
+            "--format=%h%x1f%gd%x1f%gs%x1f%cr",
         ])
 
         if not output.strip():
             console.print("[dim]No reflog entries[/dim]")
             return
 
+        entries = []
+        for line in output.splitlines():
+            fields = line.split("\x1f", 3)
+            if len(fields) == 4:
+                entries.append(fields)
+
         if output_json:
-            entries = []
-            for line in output.strip().split("\n"):
-                if line.strip():
-                    entries.append({"raw": line.strip()})
-            console.print(json.dumps({"entries": entries}, indent=2))
+            data = [
+                {"hash": h, "ref": ref, "action": action, "when": when}
+                for h, ref, action, when in entries
+            ]
+            print_json({"entries": data})
             return
 
+        from rich.table import Table
+
         table = Table(title="Reflog", border_style="green")
         table.add_column("Hash", style="yellow", width=8)
         table.add_column("Ref", style="cyan", width=16)
         table.add_column("Action", style="white")
         table.add_column("When", style="dim")
 
-        for line in output.strip().split("\n"):
-            if not line.strip():
-                continue
-            # Parse: hash ref action (time)
-            parts = line.strip().split(" ", 2)
-            if len(parts) >= 3:
-                hash_short = parts[0]
-                ref = parts[1]
-                # Split action from time
-                rest = parts[2]
-                if rest.endswith(")"):
-                    paren_idx = rest.rfind("(")
-                    if paren_idx > 0:
-                        action = rest[:paren_idx].strip()
-                        when = rest[paren_idx + 1:-1]
-                    else:
-                        action = rest
-                        when = ""
-                else:
-                    action = rest
-                    when = ""
-                table.add_row(hash_short, ref, action, when)
+        for h, ref, action, when in entries:
+            table.add_row(h, ref, action, when)
 
         console.print(table)
         console.print(f"\n[dim]Showing {limit} most recent entries[/dim]")
@@ -686,23 +722,21 @@ def shortlog(
 
         # Parse shortlog output: "  count\tAuthor Name <email>"
         authors = []
-        for line in output.strip().split("\n"):
-            line = line.strip()
-            if not line:
+        for line in output.splitlines():
+            count, tab, author_info = line.partition("\t")
+            if not tab:
                 continue
-            parts = line.split("\t", 1)
-            if len(parts) == 2:
-                count = int(parts[0].strip())
-                author_info = parts[1].strip()
-                authors.append({"count": count, "author": author_info})
+            authors.append({"count": int(count), "author": author_info})
 
         if limit:
             authors = authors[:limit]
 
         if output_json:
-            console.print(json.dumps({"authors": authors}, indent=2))
+            print_json({"authors": authors})
             return
 
+        from rich.table import Table
+
         table = Table(title="Contributors", border_style="green")
         table.add_column("Commits", style="cyan", justify="right", width=8)
         table.add_column("Author")
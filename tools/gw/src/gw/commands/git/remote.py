@@ -1,18 +1,25 @@
 """Git remote management commands."""
 
-import json
 from typing import Optional
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from ...git_wrapper import Git, GitError
+from ...json_output import print_json
 from ...safety.git import GitSafetyError, check_git_safety
 
 console = Console()
 
 
+def _print_git_error(e: GitError) -> None:
+    """Print a Git error, collapsing the not-a-repository case."""
+    if "not a git repository" in e.stderr.lower():
+        console.print("[red]Not a git repository[/red]")
+    else:
+        console.print(f"[red]Git error:[/red] {e.message}")
+
+
 @click.group()
 def remote() -> None:
     """Manage remote repositories.
@@ -51,33 +58,22 @@ def remote_list(ctx: click.Context) -> None:
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
-        output = git.execute(["remote", "-v"])
+        remotes = git.remotes()
 
-        if not output.strip():
+        if not remotes:
             if output_json:
-                console.print(json.dumps({"remotes": []}))
+                print_json({"remotes": []}, indent=False)
             else:
                 console.print("[dim]No remotes configured[/dim]")
             return
 
-        # Parse remote -v output: "name\turl (fetch/push)"
-        remotes = {}
-        for line in output.strip().split("\n"):
-            if not line.strip():
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 2:
-                name = parts[0]
-                url_and_type = parts[1]
-                url = url_and_type.rsplit(" ", 1)[0]
-                if name not in remotes:
-                    remotes[name] = url
-
         if output_json:
             data = [{"name": n, "url": u} for n, u in remotes.items()]
-            console.print(json.dumps({"remotes": data}, indent=2))
+            print_json({"remotes": data})
             return
 
+        from rich.table import Table
+
         table = Table(title="Remotes", border_style="green")
         table.add_column("Name", style="cyan")
         table.add_column("URL")
@@ -114,10 +110,14 @@ def remote_show(ctx: click.Context, name: str) -> None:
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
+        if name not in git.remotes():
+            console.print(f"[red]No such remote:[/red] {name}")
+            raise SystemExit(1)
+
         output = git.execute(["remote", "show", name])
 
         if output_json:
-            console.print(json.dumps({"remote": name, "details": output.strip()}))
+            print_json({"remote": name, "details": output.strip()}, indent=False)
         else:
             console.print(output)
 
@@ -152,21 +152,18 @@ def remote_add(ctx: click.Context, write: bool, name: str, url: str) -> None:
         raise SystemExit(1)
 
     try:
+        # No separate is_repo() probe: the remote command itself fails
+        # outside a repository and _print_git_error reports it.
         git = Git()
-
-        if not git.is_repo():
-            console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
-
-        git.execute(["remote", "add", name, url])
+        git.remote_add(name, url)
 
         if output_json:
-            console.print(json.dumps({"added": name, "url": url}))
+            print_json({"added": name, "url": url}, indent=False)
         else:
             console.print(f"[green]Added remote:[/green] {name} → {url}")
 
     except GitError as e:
-        console.print(f"[red]Git error:[/red] {e.message}")
+        _print_git_error(e)
         raise SystemExit(1)
 
 
@@ -194,21 +191,18 @@ def remote_remove(ctx: click.Context, write: bool, name: str) -> None:
         raise SystemExit(1)
 
     try:
+        # No separate is_repo() probe: the remote command itself fails
+        # outside a repository and _print_git_error reports it.
         git = Git()
-
-        if not git.is_repo():
-            console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
-
-        git.execute(["remote", "remove", name])
+        git.remote_remove(name)
 
         if output_json:
-            console.print(json.dumps({"removed": name}))
+            print_json({"removed": name}, indent=False)
         else:
             console.print(f"[green]Removed remote:[/green] {name}")
 
     except GitError as e:
-        console.print(f"[red]Git error:[/red] {e.message}")
+        _print_git_error(e)
         raise SystemExit(1)
 
 
@@ -237,19 +231,16 @@ def remote_rename(ctx: click.Context, write: bool, old_name: str, new_name: str)
         raise SystemExit(1)
 
     try:
+        # No separate is_repo() probe: the remote command itself fails
+        # outside a repository and _print_git_error reports it.
         git = Git()
-
-        if not git.is_repo():
-            console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
-
-        git.execute(["remote", "rename", old_name, new_name])
+        git.remote_rename(old_name, new_name)
 
         if output_json:
-            console.print(json.dumps({"renamed": old_name, "to": new_name}))
+            print_json({"renamed": old_name, "to": new_name}, indent=False)
         else:
             console.print(f"[green]Renamed remote:[/green] {old_name} → {new_name}")
 
     except GitError as e:
-        console.print(f"[red]Git error:[/red] {e.message}")
+        _print_git_error(e)
         raise SystemExit(1)
@@ -1,23 +1,39 @@
 """Grove Git shortcuts - convenient aliases for common workflows."""
 
-import json
-from datetime import datetime
+import time
 from typing import Optional
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 
-from ...git_wrapper import Git, GitError
+from ...git_wrapper import GitError, get_git, use_shell_batch
+from ...json_output import print_json
 from ...safety.git import (
-    GitSafetyConfig,
+    DEFAULT_GIT_SAFETY_CONFIG,
     GitSafetyError,
     check_git_safety,
     format_conventional_commit,
     validate_conventional_commit,
 )
+from ...ui import console
 
-console = Console()
+
+def _stderr_excerpt(stderr: str, limit: int = 2048) -> str:
+    """Lowercase the start and end of git error output for classification.
+
+    Git's own error lines come first and hook output (captured from
+    stdout) is appended last, so markers like "conflict" or "pre-push"
+    sit near either end. Huge conflict dumps are not lowercased in full.
+    """
+    if len(stderr) > 2 * limit:
+        stderr = stderr[:limit] + "\n" + stderr[-limit:]
+    return stderr.lower()
+
+
+def _timestamp() -> str:
+    """Format the local time as YYYY-MM-DD HH:MM for WIP commit messages."""
+    t = time.localtime()
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
 
 
 @click.command()
@@ -48,30 +64,29 @@ def fast(ctx: click.Context, write: bool, message: Optional[str], remote: str) -
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     if not message:
         console.print("[yellow]Commit message required for fast mode[/yellow]")
         console.print("[dim]Use: gw git fast --write -m \"type(scope): description\"[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     # Still validate conventional commit format
-    config = GitSafetyConfig()
+    config = DEFAULT_GIT_SAFETY_CONFIG
     valid, error = validate_conventional_commit(message, config)
     if not valid:
         console.print(f"[red]Invalid commit message:[/red] {error}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
-        # Check for changes
-        status = git.status()
-        if status.is_clean:
+        # Check for changes (stops at the first changed path)
+        if not git.has_any_change():
             console.print("[dim]No changes to commit[/dim]")
             return
 
@@ -86,36 +101,60 @@ def fast(ctx: click.Context, write: bool, message: Optional[str], remote: str) -
                 border_style="yellow",
             ))
 
-        # Step 1: Stage all
-        git.add([], all_files=True)
-        total_staged = len(status.staged) + len(status.unstaged) + len(status.untracked)
-        if not output_json:
-            console.print(f"[dim]Staged {total_staged} file(s)[/dim]")
+        if use_shell_batch():
+            # Stage, count, commit, push, and read back the hash in one
+            # process spawn instead of five.
+            output = git.execute_chain([
+                ["add", "-A"],
+                ["diff", "--cached", "--name-only", "-z"],
+                ["commit", "--quiet", "--no-verify", "-m", message],
+                ["push", "--quiet", "--no-verify", remote, current_branch],
+                ["rev-parse", "HEAD"],
+            ])
+            # --no-verify doesn't skip post-commit hooks, so stdout may
+            # hold hook output too. Paths are NUL-terminated and hook
+            # output has no NULs; the hash is always the last line.
+            total_staged = output.count("\0")
+            commit_hash = output.rstrip("\n").rpartition("\n")[2]
+            if not output_json:
+                console.print(f"[dim]Staged {total_staged} file(s)[/dim]")
+                console.print(f"[dim]Committed: {message}[/dim]")
+        else:
+            # Step 1: Stage all
+            git.add([], all_files=True)
+            total_staged = git.staged_count()
+            if not output_json:
+                console.print(f"[dim]Staged {total_staged} file(s)[/dim]")
 
-        # Step 2: Commit with --no-verify
-        commit_hash = git.commit(message, no_verify=True)
-        if not output_json:
-            console.print(f"[dim]Committed: {message}[/dim]")
+            # Step 2: Commit with --no-verify
+            commit_hash = git.commit(message, no_verify=True)
+            if not output_json:
+                console.print(f"[dim]Committed: {message}[/dim]")
 
-        # Step 3: Push with --no-verify to skip pre-push hooks
-        git.execute(["push", "--no-verify", remote, current_branch])
+            # Step 3: Push with --no-verify to skip pre-push hooks
+            git.execute(["push", "--no-verify", remote, current_branch])
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "hash": commit_hash,
                 "message": message,
                 "remote": remote,
                 "branch": current_branch,
                 "hooks_skipped": True,
-            }))
+            }, indent=False)
         else:
             console.print(f"\n[green]Done![/green] Pushed to {remote}/{current_branch}")
             console.print(f"[dim]Commit: {commit_hash[:8]}[/dim]")
             console.print("[dim]All hooks were skipped[/dim]")
 
     except GitError as e:
+        # Only the push step reports these, so the commit already exists
+        if "[rejected]" in e.stderr or "failed to push" in e.stderr:
+            console.print("[red]Committed locally, but push was rejected[/red]")
+            console.print("[dim]Run 'gw git sync --write' to rebase and push[/dim]")
+            ctx.exit(1)
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @click.command()
@@ -142,47 +181,54 @@ def save(ctx: click.Context, write: bool, message: Optional[str]) -> None:
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
-        # Check for changes
-        status = git.status()
-        if status.is_clean:
+        # Check for changes (stops at the first changed path)
+        if not git.has_any_change():
             console.print("[dim]No changes to save[/dim]")
             return
 
         # Stage all changes
         git.add([], all_files=True)
+        total_changes = git.staged_count()
 
         # Create commit message
         if not message:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+            timestamp = _timestamp()
             message = f"wip: work in progress ({timestamp})"
 
         # Commit
-        commit_hash = git.commit(message)
+        if use_shell_batch():
+            # Read the new hash back in the same spawn as the commit
+            output = git.execute_chain([
+                ["commit", "--quiet", "-m", message],
+                ["rev-parse", "HEAD"],
+            ])
+            commit_hash = output.strip().rsplit("\n", 1)[-1]
+        else:
+            commit_hash = git.commit(message)
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "hash": commit_hash,
                 "message": message,
-                "files_staged": len(status.staged) + len(status.unstaged) + len(status.untracked),
-            }))
+                "files_staged": total_changes,
+            }, indent=False)
         else:
-            total_changes = len(status.staged) + len(status.unstaged) + len(status.untracked)
             console.print(f"[green]Staged {total_changes} file(s)[/green]")
             console.print(f"[green]Committed:[/green] {message}")
             console.print(f"[dim]Hash: {commit_hash[:8]}[/dim]")
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @click.command()
@@ -211,21 +257,25 @@ def sync(ctx: click.Context, write: bool, remote: str, base_branch: str) -> None
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
         # SAFETY: Refuse to sync with a dirty working tree.
         # Rebasing with unstaged changes can silently lose work.
         # The user must decide how to handle their WIP — never auto-stash.
-        status = git.status()
-        if status.unstaged or status.untracked:
-            dirty_count = len(status.unstaged) + len(status.untracked)
+        # The cheap is_dirty() probe gates the full status scan, which is
+        # only needed to confirm and count the changes for the message.
+        dirty_count = 0
+        if git.is_dirty(include_staged=False):
+            status = git.status()
+            dirty_count = status.dirty_count
+        if dirty_count:
             console.print(
                 f"[red]Cannot sync: working tree has {dirty_count} "
                 f"uncommitted file(s)[/red]"
@@ -240,7 +290,7 @@ def sync(ctx: click.Context, write: bool, remote: str, base_branch: str) -> None
                 "\n[dim]gw will never auto-stash your work. "
                 "You decide what happens to it.[/dim]"
             )
-            raise SystemExit(1)
+            ctx.exit(1)
 
         current_branch = git.current_branch()
 
@@ -271,7 +321,7 @@ def sync(ctx: click.Context, write: bool, remote: str, base_branch: str) -> None
         try:
             git.push(remote=remote, branch=current_branch)
         except GitError as push_err:
-            push_stderr = push_err.stderr.lower()
+            push_stderr = _stderr_excerpt(push_err.stderr)
             if "non-fast-forward" in push_stderr or "fetch first" in push_stderr:
                 if not output_json:
                     console.print(
@@ -282,17 +332,17 @@ def sync(ctx: click.Context, write: bool, remote: str, base_branch: str) -> None
                 raise
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "branch": current_branch,
                 "remote": remote,
                 "base": base_branch,
                 "synced": True,
-            }))
+            }, indent=False)
         else:
             console.print(f"\n[green]Branch is up to date with {remote}/{base_branch}[/green]")
 
     except GitError as e:
-        stderr = e.stderr.lower()
+        stderr = _stderr_excerpt(e.stderr)
         if "conflict" in stderr:
             console.print("[red]Rebase conflict[/red]")
             console.print(
@@ -308,7 +358,7 @@ def sync(ctx: click.Context, write: bool, remote: str, base_branch: str) -> None
             )
         else:
             console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @click.command()
@@ -334,36 +384,43 @@ def wip(ctx: click.Context, write: bool) -> None:
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
-        # Check for staged changes
-        status = git.status()
-        if not status.staged and not status.unstaged and not status.untracked:
+        # Check for changes (stops at the first changed path)
+        if not git.has_any_change():
             console.print("[dim]No changes to commit[/dim]")
             return
-
-        # Stage all if nothing is staged
-        if not status.staged:
-            git.add([], all_files=True)
+        has_staged = git.has_staged_changes()
 
         # Create WIP commit with --no-verify
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        timestamp = _timestamp()
         message = f"wip: {timestamp} [skip ci]"
 
-        commit_hash = git.commit(message, no_verify=True)
+        if use_shell_batch():
+            # Stage (if needed), commit, and read back the hash in one spawn
+            commands = [] if has_staged else [["add", "-A"]]
+            commands.append(["commit", "--quiet", "--no-verify", "-m", message])
+            commands.append(["rev-parse", "HEAD"])
+            commit_hash = git.execute_chain(commands).strip().rsplit("\n", 1)[-1]
+        else:
+            # Stage all if nothing is staged
+            if not has_staged:
+                git.add([], all_files=True)
+
+            commit_hash = git.commit(message, no_verify=True)
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "hash": commit_hash,
                 "message": message,
-            }))
+            }, indent=False)
         else:
             console.print(f"[green]Committed:[/green] {message}")
             console.print(f"[dim]Hash: {commit_hash[:8]}[/dim]")
@@ -371,7 +428,7 @@ def wip(ctx: click.Context, write: bool) -> None:
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @click.command()
@@ -396,14 +453,14 @@ def undo(ctx: click.Context, write: bool) -> None:
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
         # Get the commit we're about to undo
         commits = git.log(limit=1)
@@ -417,12 +474,12 @@ def undo(ctx: click.Context, write: bool) -> None:
         git.reset("HEAD~1", mode="soft")
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "undone": {
                     "hash": last_commit.hash,
                     "subject": last_commit.subject,
                 },
-            }))
+            }, indent=False)
         else:
             console.print(f"[green]Undid commit:[/green] {last_commit.subject}")
             console.print(f"[dim]Hash: {last_commit.short_hash}[/dim]")
@@ -430,7 +487,7 @@ def undo(ctx: click.Context, write: bool) -> None:
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @click.command()
@@ -454,40 +511,49 @@ def amend(ctx: click.Context, write: bool, message: Optional[str]) -> None:
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
-        # Get current commit message if not provided
-        if not message:
-            commits = git.log(limit=1)
-            if not commits:
-                console.print("[yellow]No commits to amend[/yellow]")
-                return
-            message = commits[0].subject
-            if commits[0].body:
-                message += "\n\n" + commits[0].body
+        # Without a new message, let git keep the existing one rather
+        # than reading it back out with a separate log call first
+        if message:
+            amend_args = ["commit", "--amend", "--quiet", "-m", message]
+        else:
+            amend_args = ["commit", "--amend", "--quiet", "--no-edit"]
+        # Hash and subject of the rewritten commit, NUL-separated
+        log_args = ["log", "-1", "--format=%H%x00%s"]
 
-        # Amend the commit
-        git.execute(["commit", "--amend", "-m", message])
+        try:
+            if use_shell_batch():
+                output = git.execute_chain([amend_args, log_args])
+            else:
+                git.execute(amend_args)
+                output = git.execute(log_args)
+        except GitError as e:
+            if "nothing to amend" not in e.stderr:
+                raise
+            console.print("[yellow]No commits to amend[/yellow]")
+            return
 
-        # Get new hash
-        new_hash = git.execute(["rev-parse", "HEAD"]).strip()
+        # Hook output may precede the log line, so take the last line
+        new_hash, _, subject = output.strip().rsplit("\n", 1)[-1].partition("\0")
+        message = message or subject
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "hash": new_hash,
                 "message": message.split("\n")[0],
-            }))
+            }, indent=False)
         else:
             console.print(f"[green]Amended:[/green] {message.split(chr(10))[0]}")
             console.print(f"[dim]New hash: {new_hash[:8]}[/dim]")
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
@@ -1,17 +1,14 @@
 """Git tag management commands."""
 
-import json
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.syntax import Syntax
 from rich.table import Table
 
-from ...git_wrapper import Git, GitError
+from ...git_wrapper import GitError, get_git
+from ...json_output import print_json
 from ...safety.git import GitSafetyError, check_git_safety
-
-console = Console()
+from ...ui import console
 
 
 @click.group()
@@ -49,44 +46,21 @@ def tag_list(ctx: click.Context, sort_by: str, limit: Optional[int]) -> None:
     output_json = ctx.obj.get("output_json", False)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
-
-        # Sort flags
-        sort_flag = {
-            "name": "--sort=refname",
-            "date": "--sort=-creatordate",
-            "version": "--sort=-version:refname",
-        }.get(sort_by, "--sort=-version:refname")
-
-        args = ["tag", "-l", sort_flag, "--format=%(refname:short)\t%(creatordate:relative)\t%(subject)"]
-        output = git.execute(args)
-
-        if not output.strip():
-            if output_json:
-                console.print(json.dumps({"tags": []}))
-            else:
-                console.print("[dim]No tags found[/dim]")
-            return
-
-        tags = []
-        for line in output.strip().split("\n"):
-            if not line.strip():
-                continue
-            parts = line.split("\t", 2)
-            name = parts[0] if len(parts) > 0 else ""
-            date = parts[1] if len(parts) > 1 else ""
-            message = parts[2] if len(parts) > 2 else ""
-            tags.append({"name": name, "date": date, "message": message})
+            ctx.exit(1)
 
-        if limit:
-            tags = tags[:limit]
+        # Sort keys for for-each-ref
+        sort_key = {
+            "name": "refname",
+            "date": "-creatordate",
+            "version": "-version:refname",
+        }.get(sort_by, "-version:refname")
 
         if output_json:
-            console.print(json.dumps({"tags": tags}, indent=2))
+            print_json({"tags": git.tags(sort=sort_key, limit=limit)}, indent=False)
             return
 
         table = Table(title="Tags", border_style="green")
@@ -94,15 +68,22 @@ def tag_list(ctx: click.Context, sort_by: str, limit: Optional[int]) -> None:
         table.add_column("Date", style="dim")
         table.add_column("Message")
 
-        for t in tags:
-            table.add_row(t["name"], t["date"], t["message"])
+        # Rows go straight from git's output into the table
+        count = 0
+        for name, date, message in git.iter_tags(sort=sort_key, limit=limit):
+            table.add_row(name, date, message)
+            count += 1
+
+        if not count:
+            console.print("[dim]No tags found[/dim]")
+            return
 
         console.print(table)
-        console.print(f"\n[dim]{len(tags)} tag(s)[/dim]")
+        console.print(f"\n[dim]{count} tag(s)[/dim]")
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @tag.command("show")
@@ -120,23 +101,25 @@ def tag_show(ctx: click.Context, name: str) -> None:
     output_json = ctx.obj.get("output_json", False)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
         output = git.execute(["show", name])
 
         if output_json:
-            console.print(json.dumps({"tag": name, "details": output.strip()}))
+            print_json({"tag": name, "details": output.strip()}, indent=False)
         else:
+            from rich.syntax import Syntax
+
             syntax = Syntax(output, "diff", theme="monokai", line_numbers=False)
             console.print(syntax)
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @tag.command("create")
@@ -165,14 +148,14 @@ def tag_create(ctx: click.Context, write: bool, message: Optional[str], ref: Opt
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
         args = ["tag"]
         if message:
@@ -186,12 +169,12 @@ def tag_create(ctx: click.Context, write: bool, message: Optional[str], ref: Opt
         git.execute(args)
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "created": name,
                 "annotated": message is not None,
                 "message": message,
                 "ref": ref,
-            }))
+            }, indent=False)
         else:
             tag_type = "Annotated tag" if message else "Lightweight tag"
             console.print(f"[green]{tag_type} created:[/green] {name}")
@@ -201,7 +184,7 @@ def tag_create(ctx: click.Context, write: bool, message: Optional[str], ref: Opt
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
 
 
 @tag.command("delete")
@@ -226,23 +209,23 @@ def tag_delete(ctx: click.Context, write: bool, name: str) -> None:
         console.print(f"[red]Safety check failed:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
-        raise SystemExit(1)
+        ctx.exit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
-            raise SystemExit(1)
+            ctx.exit(1)
 
-        git.execute(["tag", "-d", name])
+        git.delete_tags([name])
 
         if output_json:
-            console.print(json.dumps({"deleted": name}))
+            print_json({"deleted": name}, indent=False)
         else:
             console.print(f"[green]Deleted tag:[/green] {name}")
             console.print(f"[dim]To remove from remote: git push origin --delete {name}[/dim]")
 
     except GitError as e:
         console.print(f"[red]Git error:[/red] {e.message}")
-        raise SystemExit(1)
+        ctx.exit(1)
@@ -7,8 +7,12 @@ stage → format → check → commit → push cycle with a single command.
 - prep: Preflight check (dry run of what ship would do)
 """
 
-import json
+import os
+import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -18,9 +22,10 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ...git_wrapper import Git, GitError
+from ...json_output import print_json
 from ...packages import detect_current_package, load_monorepo
 from ...safety.git import (
-    GitSafetyConfig,
+    DEFAULT_GIT_SAFETY_CONFIG,
     GitSafetyError,
     check_git_safety,
     extract_issue_number,
@@ -30,48 +35,160 @@ from ..context import _get_affected_packages
 
 console = Console()
 
+# "#123" issue references in commit messages
+_ISSUE_REF_RE = re.compile(r"#(\d+)")
 
-def _get_staged_file_paths(git: Git) -> list[str]:
-    """Get list of staged file paths."""
-    status = git.status()
-    return [path for _, path in status.staged]
+# Leading issue number on a branch slug, e.g. "348-fix-login"
+_BRANCH_NUM_RE = re.compile(r"^\d+-")
+
+# File extensions prettier is run on, as a tuple for str.endswith()
+_FORMATTABLE_SUFFIXES = (
+    ".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs",
+    ".svelte", ".css", ".scss", ".postcss",
+    ".json", ".html", ".md", ".mdx", ".yaml", ".yml",
+)
 
 
+def _is_formattable(path: str) -> bool:
+    """Check a repo-relative path's extension without building a Path.
+
+    Matches Path(path).suffix semantics: dotfiles like ".prettierrc"
+    have no extension.
+    """
+    # endswith() on a tuple rejects most paths without slicing anything
+    if not path.lower().endswith(_FORMATTABLE_SUFFIXES):
+        return False
+    return path.rpartition("/")[2].rfind(".") > 0
+
+
+def _preview_paths(paths: list[str], limit: int = 5) -> str:
+    """Join the first `limit` paths for a table cell, noting how many remain."""
+    if not paths:
+        return "(none)"
+    preview = ", ".join(islice(paths, limit))
+    if len(paths) > limit:
+        preview += f", ... (+{len(paths) - limit} more)"
+    return preview
+
+
+# A check script that only runs tsc, e.g. "tsc" or "tsc -p tsconfig.json"
+_TSC_SCRIPT_RE = re.compile(r"^tsc((?:\s+-p\s+\S+)?)$")
+
+# Below this many files a single Prettier process beats the startup cost
+# of several
+_PRETTIER_SHARD_MIN = 64
+
+
+def _run_prettier(
+    flags: list[str],
+    files: list[str],
+    timeout: int,
+    capture: bool = True,
+) -> subprocess.CompletedProcess:
+    """Run Prettier over files, sharded across CPUs for large file lists.
+
+    Args:
+        flags: Prettier flags, e.g. ["--check"]
+        files: Files to pass to Prettier
+        timeout: Overall time limit in seconds
+        capture: Capture Prettier's output. When False it is discarded
+            and stdout/stderr on the result are None.
+
+    Returns:
+        CompletedProcess with the most severe shard returncode (Prettier
+        uses 1 for unformatted files, 2 for errors) and the shards'
+        output concatenated
+
+    Raises:
+        FileNotFoundError: If bun is not installed
+        subprocess.TimeoutExpired: If the shards don't finish in time
+    """
+    shards = 1
+    if len(files) >= _PRETTIER_SHARD_MIN:
+        shards = min(os.cpu_count() or 1, len(files) // (_PRETTIER_SHARD_MIN // 2))
+
+    base_cmd = ["bun", "x", "prettier", *flags]
+    pipe = subprocess.PIPE if capture else subprocess.DEVNULL
+    if shards <= 1:
+        return subprocess.run(
+            base_cmd + files,
+            stdout=pipe,
+            stderr=pipe,
+            text=True,
+            timeout=timeout,
+        )
 
-def _run_format_on_staged(git: Git, output_json: bool) -> tuple[bool, str]:
-    """Run prettier on staged files. Returns (success, message)."""
-    staged_files = _get_staged_file_paths(git)
+    procs = [
+        subprocess.Popen(
+            base_cmd + files[i::shards],
+            stdout=pipe,
+            stderr=pipe,
+            text=True,
+        )
+        for i in range(shards)
+    ]
+    deadline = time.monotonic() + timeout
+    returncode = 0
+    stdout_parts = []
+    stderr_parts = []
+    try:
+        for proc in procs:
+            out, err = proc.communicate(timeout=max(0.0, deadline - time.monotonic()))
+            if proc.returncode and returncode in (0, 1):
+                returncode = proc.returncode
+            stdout_parts.append(out)
+            stderr_parts.append(err)
+    except subprocess.TimeoutExpired:
+        for proc in procs:
+            proc.kill()
+            proc.communicate()
+        raise
+
+    if not capture:
+        return subprocess.CompletedProcess(base_cmd + files, returncode)
+    return subprocess.CompletedProcess(
+        base_cmd + files, returncode, "".join(stdout_parts), "".join(stderr_parts)
+    )
+
+
+def _run_format_on_staged(
+    git: Git,
+    output_json: bool,
+    staged_files: Optional[list[str]] = None,
+    formattable: Optional[list[str]] = None,
+) -> tuple[bool, str]:
+    """Run prettier on staged files. Returns (success, message).
+
+    `formattable` is the already-filtered subset of `staged_files`, for
+    callers that have computed it.
+    """
+    if staged_files is None:
+        staged_files = git.staged_paths()
     if not staged_files:
         return True, "No staged files to format"
 
     # Filter to formattable extensions
-    formattable_exts = {
-        ".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs",
-        ".svelte", ".css", ".scss", ".postcss",
-        ".json", ".html", ".md", ".mdx", ".yaml", ".yml",
-    }
-
-    formattable = [
-        f for f in staged_files
-        if Path(f).suffix.lower() in formattable_exts
-    ]
+    if formattable is None:
+        formattable = [f for f in staged_files if _is_formattable(f)]
 
     if not formattable:
         return True, "No formattable files staged"
 
-    # Run prettier on the formattable files
+    # Run prettier on the formattable files. --list-different makes it
+    # print only the files it rewrote, so unchanged files aren't re-hashed
+    # by `git add`. With --write it still exits 0 after rewriting; anything
+    # else is a failure.
     try:
-        result = subprocess.run(
-            ["bun", "x", "prettier", "--write"] + formattable,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
+        result = _run_prettier(["--write", "--list-different"], formattable, timeout=60)
 
         if result.returncode == 0:
-            # Re-stage formatted files (prettier may have changed them)
-            git.add(formattable)
-            return True, f"Formatted {len(formattable)} file(s)"
+            changed = set(result.stdout.splitlines())
+            if not changed.issubset(formattable):
+                # Prettier reported a path in another form; re-stage everything
+                changed = set(formattable)
+            if changed:
+                git.add(sorted(changed))
+            return True, f"Formatted {len(formattable)} file(s), {len(changed)} changed"
         else:
             # Try to re-stage anyway (some files may have been formatted)
             try:
@@ -86,10 +203,74 @@ def _run_format_on_staged(git: Git, output_json: bool) -> tuple[bool, str]:
         return False, "Prettier timed out (60s limit)"
 
 
-def _run_type_check(staged_files: list[str], output_json: bool) -> tuple[bool, str]:
-    """Run type checking on affected packages. Returns (success, message)."""
-    packages = _get_affected_packages(staged_files)
+def _run_format_check(formattable: list[str]) -> tuple[bool, str]:
+    """Run prettier --check on files without writing. Returns (success, message)."""
+    if not formattable:
+        return True, "No formattable files"
+
+    try:
+        # Only the exit code is reported, so don't pipe Prettier's
+        # per-file output back into Python
+        result = _run_prettier(["--check"], formattable, timeout=30, capture=False)
+    except FileNotFoundError:
+        return True, "bun not available — skipping format check"
+    except subprocess.TimeoutExpired:
+        return True, "Format check timed out"
+
+    if result.returncode == 0:
+        return True, f"All {len(formattable)} file(s) formatted correctly"
+    return False, f"{len(formattable)} file(s) need formatting — run `gw fmt` or `gw git ship` will auto-fix"
+
 
+def _check_command(pkg_path: Path, script: str) -> list[str]:
+    """Build the type-check command for a package.
+
+    A check script that is just `tsc` (optionally `-p <config>`) runs the
+    package's local tsc binary directly, skipping the shell and pnpm
+    startup. Anything else goes through `pnpm run check`.
+    """
+    match = _TSC_SCRIPT_RE.match(script.strip())
+    if match and os.name != "nt":
+        tsc = pkg_path / "node_modules" / ".bin" / "tsc"
+        if tsc.is_file():
+            return [str(tsc), *match.group(1).split()]
+    return ["pnpm", "run", "check"]
+
+
+def _check_one_package(
+    pkg_name: str,
+    pkg_path: Path,
+    script: str = "",
+) -> tuple[str, Optional[str]]:
+    """Run one package's check script. Returns (name, error or None)."""
+    try:
+        result = subprocess.run(
+            _check_command(pkg_path, script),
+            cwd=pkg_path,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        if result.returncode != 0:
+            return pkg_name, result.stderr[:300] or result.stdout[:300]
+    except subprocess.TimeoutExpired:
+        return pkg_name, "Type check timed out (120s limit)"
+    except subprocess.SubprocessError as e:
+        return pkg_name, str(e)
+    return pkg_name, None
+
+
+def _run_type_check(
+    packages: list[str],
+    output_json: bool,
+    jobs: Optional[int] = None,
+) -> tuple[bool, str]:
+    """Run type checking on affected packages. Returns (success, message).
+
+    `packages` comes from _get_affected_packages(), computed once by the
+    caller. Packages are checked concurrently, up to `jobs` at a time
+    (default: CPU count).
+    """
     if not packages or packages == ["root"]:
         return True, "No package-level changes to type-check"
 
@@ -97,41 +278,26 @@ def _run_type_check(staged_files: list[str], output_json: bool) -> tuple[bool, s
     if not monorepo:
         return True, "Not in a monorepo — skipping type check"
 
-    errors = []
-    checked = []
-
-    for pkg_name in packages:
-        if pkg_name.startswith("tools/"):
-            continue  # Python tools — skip TS type check
+    # Index packages that have a check script once, instead of a linear
+    # find_package() scan per affected package
+    checkable = {pkg.name: pkg for pkg in monorepo.packages if "check" in pkg.scripts}
 
-        pkg = monorepo.find_package(pkg_name)
-        if not pkg:
-            continue
-
-        # Check if package has a check script
-        if "check" not in pkg.scripts:
-            continue
-
-        checked.append(pkg_name)
+    targets = [
+        (pkg_name, checkable[pkg_name].path, checkable[pkg_name].scripts["check"])
+        for pkg_name in packages
+        # tools/* are Python packages — no TS type check
+        if not pkg_name.startswith("tools/") and pkg_name in checkable
+    ]
 
-        try:
-            result = subprocess.run(
-                ["pnpm", "run", "check"],
-                cwd=pkg.path,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            if result.returncode != 0:
-                errors.append((pkg_name, result.stderr[:300] or result.stdout[:300]))
-        except subprocess.TimeoutExpired:
-            errors.append((pkg_name, "Type check timed out (120s limit)"))
-        except subprocess.SubprocessError as e:
-            errors.append((pkg_name, str(e)))
-
-    if not checked:
+    if not targets:
         return True, "No packages with type checking"
 
+    checked = [name for name, _, _ in targets]
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(targets)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(lambda target: _check_one_package(*target), targets))
+    errors = [(name, msg) for name, msg in outcomes if msg is not None]
+
     if errors:
         error_details = "; ".join(f"{name}: {msg}" for name, msg in errors)
         return False, f"Type errors in {len(errors)} package(s): {error_details}"
@@ -146,6 +312,7 @@ def _run_type_check(staged_files: list[str], output_json: bool) -> tuple[bool, s
 @click.option("--no-check", is_flag=True, help="Skip type checking")
 @click.option("--no-format", is_flag=True, help="Skip formatting")
 @click.option("--all", "-a", "stage_all", is_flag=True, help="Auto-stage all changes before shipping")
+@click.option("--jobs", "-j", type=int, default=None, help="Packages to type-check in parallel (default: CPU count)")
 @click.argument("remote", default="origin")
 @click.pass_context
 def ship(
@@ -156,6 +323,7 @@ def ship(
     no_check: bool,
     no_format: bool,
     stage_all: bool,
+    jobs: Optional[int],
     remote: str,
 ) -> None:
     """Format, check, commit, and push in one step.
@@ -203,19 +371,20 @@ def ship(
             if not output_json:
                 console.print("[dim]Auto-staged all changes[/dim]")
 
-        # Check for staged changes
-        status = git.status()
-        if not status.staged:
-            if status.unstaged or status.untracked:
+        # Check for staged changes. Only the index is needed here, so skip
+        # a full status walk; look at the worktree only to explain a miss.
+        staged_files = git.staged_paths()
+        if not staged_files:
+            if git.has_any_change():
                 console.print("[yellow]No staged changes to ship[/yellow]")
                 console.print("[dim]Use --all / -a to auto-stage, or stage manually: gw git add --write <files>[/dim]")
             else:
                 console.print("[yellow]Nothing to ship — working directory clean[/yellow]")
             raise SystemExit(1)
 
-        config = GitSafetyConfig()
+        config = DEFAULT_GIT_SAFETY_CONFIG
         current_branch = git.current_branch()
-        staged_files = _get_staged_file_paths(git)
+        affected = _get_affected_packages(staged_files)
 
         # Auto-detect issue from branch name
         if issue is None and config.auto_link_issues:
@@ -249,7 +418,7 @@ def ship(
         if not no_format:
             if not output_json:
                 console.print("[dim]Formatting staged files...[/dim]")
-            fmt_ok, fmt_msg = _run_format_on_staged(git, output_json)
+            fmt_ok, fmt_msg = _run_format_on_staged(git, output_json, staged_files)
             results.append(("Format", fmt_ok, fmt_msg))
             if not output_json:
                 icon = "✓" if fmt_ok else "✗"
@@ -263,7 +432,7 @@ def ship(
         if not no_check:
             if not output_json:
                 console.print("[dim]Running type checks...[/dim]")
-            check_ok, check_msg = _run_type_check(staged_files, output_json)
+            check_ok, check_msg = _run_type_check(affected, output_json, jobs)
             results.append(("Check", check_ok, check_msg))
             if not output_json:
                 icon = "✓" if check_ok else "⚠"
@@ -309,18 +478,19 @@ def ship(
 
         # Summary
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "shipped": True,
                 "hash": commit_hash,
                 "message": message,
                 "remote": remote,
                 "branch": current_branch,
                 "issue": issue,
+                "packages": affected,
                 "steps": [
                     {"name": name, "ok": ok, "detail": detail}
                     for name, ok, detail in results
                 ],
-            }))
+            }, indent=False)
         else:
             console.print(f"\n[bold green]Shipped![/bold green] {commit_hash[:8]} → {remote}/{current_branch}")
             if issue:
@@ -332,8 +502,9 @@ def ship(
 
 
 @click.command()
+@click.option("--jobs", "-j", type=int, default=None, help="Packages to type-check in parallel (default: CPU count)")
 @click.pass_context
-def prep(ctx: click.Context) -> None:
+def prep(ctx: click.Context, jobs: Optional[int]) -> None:
     """Pre-commit preflight check — dry run of what ship would do.
 
     This is a READ operation (no --write needed). It checks:
@@ -358,8 +529,8 @@ def prep(ctx: click.Context) -> None:
             raise SystemExit(1)
 
         status = git.status()
-        staged_files = [path for _, path in status.staged]
-        unstaged_files = [path for _, path in status.unstaged]
+        staged_files = status.staged_paths
+        unstaged_files = status.unstaged_paths
         current_branch = git.current_branch()
 
         if not output_json:
@@ -378,91 +549,52 @@ def prep(ctx: click.Context) -> None:
             table.add_column("Count", style="bold", width=6)
             table.add_column("Files", style="dim")
 
-            staged_preview = ", ".join(staged_files[:5])
-            if len(staged_files) > 5:
-                staged_preview += f", ... (+{len(staged_files) - 5} more)"
-
-            unstaged_preview = ", ".join(unstaged_files[:5])
-            if len(unstaged_files) > 5:
-                unstaged_preview += f", ... (+{len(unstaged_files) - 5} more)"
-
-            untracked_preview = ", ".join(status.untracked[:5])
-            if len(status.untracked) > 5:
-                untracked_preview += f", ... (+{len(status.untracked) - 5} more)"
-
-            table.add_row("Staged", str(len(staged_files)), staged_preview or "(none)")
-            table.add_row("Unstaged", str(len(unstaged_files)), unstaged_preview or "(none)")
-            table.add_row("Untracked", str(len(status.untracked)), untracked_preview or "(none)")
+            for category, paths in (
+                ("Staged", staged_files),
+                ("Unstaged", unstaged_files),
+                ("Untracked", status.untracked),
+            ):
+                table.add_row(category, str(len(paths)), _preview_paths(paths))
             console.print(table)
             console.print()
 
         if not staged_files:
             if output_json:
-                console.print(json.dumps({"ready": False, "reason": "Nothing staged"}))
+                print_json({"ready": False, "reason": "Nothing staged"}, indent=False)
             else:
                 console.print("[yellow]Nothing staged — nothing to ship[/yellow]")
                 console.print("[dim]Stage changes: gw git add --write <files>[/dim]")
             raise SystemExit(1)
 
-        # Check 1: Prettier formatting
+        # Checks 1 and 2 are independent read-only subprocesses, so run
+        # Prettier's --check alongside the type check
         if not output_json:
-            console.print("[dim]Checking formatting...[/dim]")
-
-        formattable_exts = {
-            ".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs",
-            ".svelte", ".css", ".scss", ".postcss",
-            ".json", ".html", ".md", ".mdx", ".yaml", ".yml",
-        }
+            console.print("[dim]Checking formatting and types...[/dim]")
 
-        formattable = [
-            f for f in staged_files
-            if Path(f).suffix.lower() in formattable_exts
-        ]
+        formattable = [f for f in staged_files if _is_formattable(f)]
+        affected = _get_affected_packages(staged_files)
 
-        fmt_ok = True
-        fmt_msg = "No formattable files"
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fmt_future = executor.submit(_run_format_check, formattable)
+            check_future = executor.submit(_run_type_check, affected, output_json, jobs)
+            fmt_ok, fmt_msg = fmt_future.result()
+            check_ok, check_msg = check_future.result()
 
-        if formattable:
-            try:
-                result = subprocess.run(
-                    ["bun", "x", "prettier", "--check"] + formattable,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                if result.returncode == 0:
-                    fmt_msg = f"All {len(formattable)} file(s) formatted correctly"
-                else:
-                    fmt_ok = False
-                    all_pass = False
-                    # Extract unformatted files from stderr
-                    fmt_msg = f"{len(formattable)} file(s) need formatting — run `gw fmt` or `gw git ship` will auto-fix"
-            except FileNotFoundError:
-                fmt_msg = "bun not available — skipping format check"
-            except subprocess.TimeoutExpired:
-                fmt_msg = "Format check timed out"
+        if not fmt_ok or not check_ok:
+            all_pass = False
 
         if not output_json:
             icon = "✓" if fmt_ok else "✗"
             color = "green" if fmt_ok else "red"
             console.print(f"  [{color}]{icon}[/{color}] Format: {fmt_msg}")
 
-        # Check 2: Type checking
-        if not output_json:
-            console.print("[dim]Checking types...[/dim]")
-
-        check_ok, check_msg = _run_type_check(staged_files, output_json)
-        if not check_ok:
-            all_pass = False
-
-        if not output_json:
             icon = "✓" if check_ok else "✗"
             color = "green" if check_ok else "red"
             console.print(f"  [{color}]{icon}[/{color}] Types: {check_msg}")
 
         # Summary
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "ready": all_pass,
                 "branch": current_branch,
                 "staged": len(staged_files),
@@ -470,8 +602,8 @@ def prep(ctx: click.Context) -> None:
                 "untracked": len(status.untracked),
                 "format": {"ok": fmt_ok, "detail": fmt_msg},
                 "types": {"ok": check_ok, "detail": check_msg},
-                "packages": _get_affected_packages(staged_files),
-            }, indent=2))
+                "packages": affected,
+            })
         else:
             console.print()
             if all_pass:
@@ -506,8 +638,6 @@ def pr_prep(ctx: click.Context, base: str) -> None:
         gw git pr-prep                 # Compare against main
         gw git pr-prep --base develop  # Compare against develop
     """
-    import re as _re
-
     output_json = ctx.obj.get("output_json", False)
 
     try:
@@ -522,7 +652,7 @@ def pr_prep(ctx: click.Context, base: str) -> None:
         if current_branch == base:
             msg = f"Already on {base} — switch to a feature branch first"
             if output_json:
-                console.print(json.dumps({"error": msg}))
+                print_json({"error": msg}, indent=False)
             else:
                 console.print(f"[yellow]{msg}[/yellow]")
             raise SystemExit(1)
@@ -536,16 +666,14 @@ def pr_prep(ctx: click.Context, base: str) -> None:
         # Get commits since merge base
         branch_commits = []
         try:
+            # -z ends each commit with NUL; %x1f (unit separator) splits fields
             commit_output = git.execute([
-                "log", f"{merge_base}..HEAD",
-                "--format=%h%x00%an%x00%aI%x00%s%x00%x1e",
+                "log", "-z", f"{merge_base}..HEAD",
+                "--format=%h%x1f%an%x1f%aI%x1f%s",
             ])
-            for entry in commit_output.split("\x1e"):
-                entry = entry.strip()
-                if not entry:
-                    continue
-                parts = entry.split("\x00")
-                if len(parts) >= 4:
+            for entry in commit_output.split("\0"):
+                parts = entry.split("\x1f", 3)
+                if len(parts) == 4:
                     branch_commits.append({
                         "hash": parts[0],
                         "author": parts[1],
@@ -562,8 +690,7 @@ def pr_prep(ctx: click.Context, base: str) -> None:
             diff = git.diff(stat_only=True)
 
         # Affected packages from changed files
-        changed_files = [f["path"] for f in diff.files]
-        affected = _get_affected_packages(changed_files)
+        affected = _get_affected_packages(f["path"] for f in diff.files)
 
         # Issue from branch name
         issue = git.extract_issue_from_branch(current_branch)
@@ -572,9 +699,9 @@ def pr_prep(ctx: click.Context, base: str) -> None:
         referenced_issues = set()
         if issue:
             referenced_issues.add(issue)
-        for c in branch_commits:
-            for m in _re.finditer(r'#(\d+)', c.get("message", "")):
-                referenced_issues.add(int(m.group(1)))
+        # One findall over all subjects; "\n" can't be part of a "#123" match
+        joined = "\n".join(c["message"] for c in branch_commits)
+        referenced_issues.update(int(num) for num in _ISSUE_REF_RE.findall(joined))
 
         # Suggest title from first commit or branch name
         suggested_title = ""
@@ -583,7 +710,7 @@ def pr_prep(ctx: click.Context, base: str) -> None:
         elif "/" in current_branch:
             parts = current_branch.split("/", 1)
             slug = parts[1] if len(parts) > 1 else parts[0]
-            slug = _re.sub(r'^\d+-', '', slug).replace("-", " ").replace("_", " ")
+            slug = _BRANCH_NUM_RE.sub("", slug).replace("-", " ").replace("_", " ")
             suggested_title = f"{parts[0]}: {slug}"
 
         # Check push status
@@ -592,7 +719,7 @@ def pr_prep(ctx: click.Context, base: str) -> None:
         ready = pushed and not uncommitted
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "branch": current_branch,
                 "base": base,
                 "commits": len(branch_commits),
@@ -606,7 +733,7 @@ def pr_prep(ctx: click.Context, base: str) -> None:
                 "uncommitted": uncommitted,
                 "ready": ready,
                 "ahead": status.ahead,
-            }, indent=2))
+            })
         else:
             console.print(Panel(
                 f"Branch: [cyan]{current_branch}[/cyan] -> [dim]{base}[/dim]\n"
@@ -644,7 +771,7 @@ def pr_prep(ctx: click.Context, base: str) -> None:
 
     except GitError as e:
         if output_json:
-            console.print(json.dumps({"error": e.message}))
+            print_json({"error": e.message}, indent=False)
         else:
             console.print(f"[red]Git error:[/red] {e.message}")
         raise SystemExit(1)
@@ -1,19 +1,28 @@
 """Worktree commands for simplified multi-branch development."""
 
-import json
+import functools
 import os
 import re
+import shlex
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows — appends go unlocked
+    fcntl = None
+
 import click
 from rich.console import Console
 from rich.table import Table
 
 from ...ui import success, error, info, warning, is_interactive
 from ...gh_wrapper import GitHub, GitHubError
+from ...git_wrapper import use_shell_batch
+from ...json_output import print_json
 from ...safety.git import GitSafetyError, check_git_safety
 
 console = Console()
@@ -21,24 +30,65 @@ console = Console()
 # Worktree directory name (inside repo, gitignored)
 WORKTREE_DIR = ".gw-worktrees"
 
+# Characters not allowed in a worktree directory name
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9_-]")
 
-def get_repo_root() -> Path:
-    """Get the git repository root."""
+
+@functools.lru_cache(maxsize=8)
+def _repo_root_for_dir(cwd: str) -> Path:
     result = subprocess.run(
         ["git", "rev-parse", "--show-toplevel"],
         capture_output=True,
         text=True,
+        stdin=subprocess.DEVNULL,
+        cwd=cwd,
     )
     if result.returncode != 0:
         raise click.ClickException("Not in a git repository")
     return Path(result.stdout.strip())
 
 
+def get_repo_root() -> Path:
+    """Get the git repository root.
+
+    Memoized per working directory, so the many lookups in one command
+    spawn `git rev-parse` only once.
+    """
+    return _repo_root_for_dir(os.getcwd())
+
+
 def get_worktree_base() -> Path:
     """Get the base directory for gw-managed worktrees."""
     return get_repo_root() / WORKTREE_DIR
 
 
+def _append_gitignore_entry(gitignore: Path, name: str) -> bool:
+    """Append a directory entry to .gitignore unless it is already there.
+
+    The check and the write happen under an exclusive lock with a single
+    O_APPEND write, so concurrent gw runs can't interleave or duplicate
+    the entry.
+
+    Returns:
+        True if the entry was written
+    """
+    flags = (
+        os.O_WRONLY | os.O_APPEND
+        | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    )
+    fd = os.open(gitignore, flags)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        # Another gw run may have added it while we waited for the lock
+        if name.encode() in gitignore.read_bytes():
+            return False
+        os.write(fd, f"\n# gw-managed worktrees\n{name}/\n".encode())
+        return True
+    finally:
+        os.close(fd)
+
+
 def ensure_worktree_dir_exists() -> Path:
     """Ensure the worktree directory exists and is gitignored."""
     base = get_worktree_base()
@@ -46,11 +96,12 @@ def ensure_worktree_dir_exists() -> Path:
 
     # Ensure it's gitignored
     gitignore = get_repo_root() / ".gitignore"
-    if gitignore.exists():
+    try:
         content = gitignore.read_text()
-        if WORKTREE_DIR not in content:
-            with open(gitignore, "a") as f:
-                f.write(f"\n# gw-managed worktrees\n{WORKTREE_DIR}/\n")
+    except FileNotFoundError:
+        content = None
+    if content is not None and WORKTREE_DIR not in content:
+        if _append_gitignore_entry(gitignore, WORKTREE_DIR):
             info(f"Added {WORKTREE_DIR}/ to .gitignore")
 
     return base
@@ -82,38 +133,61 @@ def resolve_ref(ref: str) -> tuple[str, str, str]:
         return branch_name, f"issue-{issue_number}", "issue"
 
     # Branch name - sanitize for directory name
-    safe_name = re.sub(r"[^a-zA-Z0-9_-]", "-", ref)
+    safe_name = _UNSAFE_NAME_CHARS_RE.sub("-", ref)
     return ref, safe_name, "branch"
 
 
+def resolve_worktree_path(ref: str) -> tuple[str, Path]:
+    """Resolve a reference to its worktree name and path.
+
+    PR worktrees are always named ``pr-<number>``, so when that directory
+    already exists there's no need to ask GitHub for the PR's branch.
+
+    Args:
+        ref: PR number (920), issue ref (#450), or branch name
+
+    Returns:
+        Tuple of (worktree_name, worktree_path)
+    """
+    base = get_worktree_base()
+    if ref.isdigit():
+        candidate = base / f"pr-{ref}"
+        if candidate.exists():
+            return candidate.name, candidate
+
+    _, worktree_name, _ = resolve_ref(ref)
+    return worktree_name, base / worktree_name
+
+
 def get_existing_worktrees() -> list[dict]:
     """Get list of existing git worktrees."""
     result = subprocess.run(
         ["git", "worktree", "list", "--porcelain"],
         capture_output=True,
         text=True,
+        stdin=subprocess.DEVNULL,
     )
 
     worktrees = []
     current = {}
 
-    for line in result.stdout.strip().split("\n"):
+    for line in result.stdout.splitlines():
         if not line:
             if current:
                 worktrees.append(current)
                 current = {}
             continue
 
-        if line.startswith("worktree "):
-            current["path"] = line[9:]
-        elif line.startswith("HEAD "):
-            current["head"] = line[5:]
-        elif line.startswith("branch "):
-            current["branch"] = line[7:].replace("refs/heads/", "")
-        elif line == "detached":
-            current["detached"] = True
-        elif line == "bare":
-            current["bare"] = True
+        # Each line is "<key>" or "<key> <value>"
+        key, _, value = line.partition(" ")
+        if key == "worktree":
+            current["path"] = value
+        elif key == "HEAD":
+            current["head"] = value
+        elif key == "branch":
+            current["branch"] = value.removeprefix("refs/heads/")
+        elif key == "detached" or key == "bare":
+            current[key] = True
 
     if current:
         worktrees.append(current)
@@ -121,6 +195,68 @@ def get_existing_worktrees() -> list[dict]:
     return worktrees
 
 
+def _pnpm_install_commands(worktree_path: Path) -> list[list[str]]:
+    """Pick the pnpm install commands to try, in order.
+
+    `--frozen-lockfile` is tried first unless it is likely to fail: when
+    there is no pnpm-lock.yaml, or when the newest commit touching any
+    package.json or the lockfile changed a package.json but not the
+    lockfile. File mtimes in a fresh checkout say nothing, so ask git.
+    Guessing wrong is cheap: a plain install of a current lockfile
+    resolves the same way.
+    """
+    plain = ["pnpm", "install"]
+    if not (worktree_path / "pnpm-lock.yaml").exists():
+        return [plain]
+
+    result = subprocess.run(
+        [
+            "git", "log", "-1", "--name-only", "--format=", "--",
+            "pnpm-lock.yaml", ":(glob)**/package.json",
+        ],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        cwd=worktree_path,
+    )
+    changed = set(result.stdout.splitlines())
+    if changed and "pnpm-lock.yaml" not in changed:
+        return [plain]
+    return [["pnpm", "install", "--frozen-lockfile"], plain]
+
+
+def _start_background_install(worktree_path: Path) -> tuple[int, Path]:
+    """Start `pnpm install` detached from this process.
+
+    Output goes to install.log in the worktree's git admin directory, which
+    keeps the worktree itself clean and is deleted with the worktree.
+
+    Returns:
+        Tuple of (pid, log path)
+    """
+    script = " || ".join(shlex.join(cmd) for cmd in _pnpm_install_commands(worktree_path))
+    git_dir = subprocess.run(
+        ["git", "rev-parse", "--absolute-git-dir"],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        cwd=worktree_path,
+    ).stdout.strip()
+    log_path = Path(git_dir or worktree_path) / "install.log"
+    with open(log_path, "w") as log:
+        proc = subprocess.Popen(
+            # Same install attempts, in order, as the blocking path
+            script,
+            shell=True,
+            cwd=worktree_path,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+    return proc.pid, log_path
+
+
 @click.group()
 def worktree() -> None:
     """Manage git worktrees with ease.
@@ -139,13 +275,181 @@ def worktree() -> None:
     pass
 
 
+def _create_worktree(
+    branch_name: str,
+    worktree_path: Path,
+    ref_type: str,
+    new: bool,
+    no_install: bool,
+    install_async: bool,
+    quiet: bool,
+) -> dict:
+    """Create one worktree and install its dependencies.
+
+    Safe to run for several worktrees at once: it only touches its own
+    worktree directory and branch.
+
+    Args:
+        branch_name: Branch to check out
+        worktree_path: Directory for the new worktree
+        ref_type: "pr", "issue", or "branch" (reported back)
+        new: Create the branch if it doesn't exist
+        no_install: Skip dependency installation
+        install_async: Install dependencies in the background
+        quiet: Suppress progress messages
+
+    Returns:
+        JSON-ready result: "created" plus details on success, or "error"
+        with an optional "hint" or "path" on failure
+    """
+    # Claim the directory with an atomic mkdir so that of several creates
+    # racing for the same name exactly one proceeds; git worktree add
+    # accepts an existing empty directory
+    try:
+        worktree_path.mkdir()
+    except FileExistsError:
+        return {"error": "Worktree already exists", "path": str(worktree_path)}
+
+    # Check if the branch exists locally and/or on origin in one call
+    local_ref = f"refs/heads/{branch_name}"
+    remote_ref = f"refs/remotes/origin/{branch_name}"
+    refs_result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname)", local_ref, remote_ref],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    found_refs = set(refs_result.stdout.splitlines())
+    branch_exists = local_ref in found_refs
+    remote_exists = remote_ref in found_refs
+
+    if not branch_exists and not remote_exists:
+        if not new:
+            worktree_path.rmdir()
+            return {
+                "error": f"Branch '{branch_name}' not found",
+                "hint": "Use --new to create it, or check the branch name",
+            }
+        # Create new branch with worktree
+        if not quiet:
+            info(f"Creating new branch '{branch_name}'...")
+        result = subprocess.run(
+            ["git", "worktree", "add", "-b", branch_name, str(worktree_path)],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+    else:
+        add_cmd = ["git", "worktree", "add", str(worktree_path), branch_name]
+
+        # Fetch remote branch if needed
+        if remote_exists and not branch_exists:
+            if not quiet:
+                info(f"Fetching remote branch '{branch_name}'...")
+            fetch_cmd = ["git", "fetch", "origin", branch_name]
+            if use_shell_batch():
+                # One shell for fetch + add. The fetch result was never
+                # checked, so ";" keeps going and its output is dropped.
+                result = subprocess.run(
+                    f"{shlex.join(fetch_cmd)} >/dev/null 2>&1; {shlex.join(add_cmd)}",
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    stdin=subprocess.DEVNULL,
+                )
+            else:
+                subprocess.run(
+                    fetch_cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                result = subprocess.run(
+                    add_cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL,
+                )
+        else:
+            result = subprocess.run(
+                add_cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL,
+            )
+
+    if result.returncode != 0:
+        # Release the claim; git cleans up anything it started writing
+        try:
+            worktree_path.rmdir()
+        except OSError:
+            pass
+        return {"error": f"Failed to create worktree: {result.stderr.strip()}"}
+
+    # Auto-install dependencies
+    data = {
+        "created": True,
+        "path": str(worktree_path),
+        "branch": branch_name,
+        "ref_type": ref_type,
+        "deps_installed": False,
+    }
+    package_json = worktree_path / "package.json"
+    if no_install or not package_json.exists():
+        return data
+
+    if install_async:
+        install_pid, install_log = _start_background_install(worktree_path)
+        data["deps_installed"] = "pending"
+        data["install_pid"] = install_pid
+        data["install_log"] = str(install_log)
+        if not quiet:
+            info(f"Installing dependencies in the background (pid {install_pid})")
+            console.print(f"[dim]Log: {install_log}[/dim]")
+        return data
+
+    if not quiet:
+        info("Installing dependencies (pnpm install)...")
+    for cmd in _pnpm_install_commands(worktree_path):
+        # Only the exit status matters; don't buffer pnpm's output
+        install_result = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=worktree_path,
+        )
+        if install_result.returncode == 0:
+            data["deps_installed"] = True
+            break
+    if not quiet:
+        if data["deps_installed"]:
+            success("Dependencies installed")
+        else:
+            warning("Could not install dependencies — run pnpm install manually")
+    return data
+
+
+def _print_create_error(result: dict, prefix: str = "") -> None:
+    """Print a failed _create_worktree() result."""
+    if "path" in result:
+        warning(f"{prefix}{result['error']} at {result['path']}")
+        info(f"Use: cd {result['path']}")
+    else:
+        error(f"{prefix}{result['error']}")
+        if "hint" in result:
+            info(result["hint"])
+
+
 @worktree.command("create")
-@click.argument("ref")
+@click.argument("refs", metavar="REF...", nargs=-1, required=True)
 @click.option("--write", is_flag=True, help="Confirm write operation")
 @click.option("--new", "-n", is_flag=True, help="Create new branch if it doesn't exist")
 @click.option("--no-install", is_flag=True, help="Skip dependency installation")
+@click.option("--install-async", is_flag=True, help="Install dependencies in the background")
 @click.pass_context
-def worktree_create(ctx: click.Context, ref: str, write: bool, new: bool, no_install: bool) -> None:
+def worktree_create(
+    ctx: click.Context,
+    refs: tuple[str, ...],
+    write: bool,
+    new: bool,
+    no_install: bool,
+    install_async: bool,
+) -> None:
     """Create a worktree for a PR, issue, or branch.
 
     REF can be:
@@ -153,7 +457,12 @@ def worktree_create(ctx: click.Context, ref: str, write: bool, new: bool, no_ins
     - An issue ref (#450) - uses issue-450 branch
     - A branch name (feature/foo)
 
+    Several REFs create their worktrees in parallel.
+
     Automatically installs dependencies (pnpm install) unless --no-install.
+    With --install-async, pnpm runs detached and logs to install.log in the
+    worktree's git admin directory, so you can cd in right away (JSON
+    reports deps_installed as "pending").
 
     \b
     Examples:
@@ -161,6 +470,8 @@ def worktree_create(ctx: click.Context, ref: str, write: bool, new: bool, no_ins
         gw git worktree create --write #450 --new
         gw git worktree create --write feature/auth
         gw git worktree create --write feature/auth --no-install
+        gw git worktree create --write 920 --install-async
+        gw git worktree create --write 920 921 #450
     """
     output_json = ctx.obj.get("output_json", False)
 
@@ -172,108 +483,44 @@ def worktree_create(ctx: click.Context, ref: str, write: bool, new: bool, no_ins
             console.print(f"[dim]{e.suggestion}[/dim]")
         raise SystemExit(1)
 
-    branch_name, worktree_name, ref_type = resolve_ref(ref)
-
-    base = ensure_worktree_dir_exists()
-    worktree_path = base / worktree_name
-
-    if worktree_path.exists():
-        if output_json:
-            console.print(json.dumps({"error": "Worktree already exists", "path": str(worktree_path)}))
+    # Resolve up front so a bad REF fails before anything is created.
+    # Refs for the same branch are created once; a different branch whose
+    # name sanitizes to an already-claimed worktree dir is reported instead.
+    targets = {}
+    collisions = {}
+    order = []
+    for ref in refs:
+        branch_name, worktree_name, ref_type = resolve_ref(ref)
+        claimed = targets.get(worktree_name)
+        if claimed is None:
+            targets[worktree_name] = (ref, branch_name, ref_type)
+        elif claimed[1] == branch_name:
+            continue
         else:
-            warning(f"Worktree already exists at {worktree_path}")
-            info(f"Use: cd {worktree_path}")
-        raise SystemExit(1)
+            collisions[ref] = {
+                "error": f"Worktree name '{worktree_name}' is already used by {claimed[0]}",
+                "hint": "Create it separately after finishing the other worktree",
+            }
+        order.append(ref)
 
-    # Check if branch exists
-    branch_exists = subprocess.run(
-        ["git", "rev-parse", "--verify", f"refs/heads/{branch_name}"],
-        capture_output=True,
-    ).returncode == 0
-
-    # Also check remote
-    remote_exists = subprocess.run(
-        ["git", "rev-parse", "--verify", f"refs/remotes/origin/{branch_name}"],
-        capture_output=True,
-    ).returncode == 0
-
-    if not branch_exists and not remote_exists:
-        if new:
-            # Create new branch with worktree
-            info(f"Creating new branch '{branch_name}'...")
-            result = subprocess.run(
-                ["git", "worktree", "add", "-b", branch_name, str(worktree_path)],
-                capture_output=True,
-                text=True,
-            )
-        else:
-            if output_json:
-                console.print(json.dumps({"error": f"Branch '{branch_name}' not found", "hint": "Use --new to create it"}))
-            else:
-                error(f"Branch '{branch_name}' not found")
-                info("Use --new to create it, or check the branch name")
-            raise SystemExit(1)
-    else:
-        # Fetch remote branch if needed
-        if remote_exists and not branch_exists:
-            info(f"Fetching remote branch '{branch_name}'...")
-            subprocess.run(["git", "fetch", "origin", branch_name], capture_output=True)
+    base = ensure_worktree_dir_exists()
 
-        result = subprocess.run(
-            ["git", "worktree", "add", str(worktree_path), branch_name],
-            capture_output=True,
-            text=True,
+    if len(targets) == 1 and not collisions:
+        worktree_name, (_, branch_name, ref_type) = next(iter(targets.items()))
+        worktree_path = base / worktree_name
+        result = _create_worktree(
+            branch_name, worktree_path, ref_type,
+            new, no_install, install_async, quiet=output_json,
         )
-
-    if result.returncode != 0:
         if output_json:
-            console.print(json.dumps({"error": result.stderr.strip()}))
-        else:
-            error(f"Failed to create worktree: {result.stderr.strip()}")
-        raise SystemExit(1)
-
-    # Auto-install dependencies
-    deps_installed = False
-    if not no_install:
-        package_json = worktree_path / "package.json"
-        if package_json.exists():
-            if not output_json:
-                info("Installing dependencies (pnpm install)...")
-            install_result = subprocess.run(
-                ["pnpm", "install", "--frozen-lockfile"],
-                capture_output=True,
-                text=True,
-                cwd=worktree_path,
-            )
-            if install_result.returncode == 0:
-                deps_installed = True
-                if not output_json:
-                    success("Dependencies installed")
-            else:
-                # Try without frozen lockfile
-                install_result = subprocess.run(
-                    ["pnpm", "install"],
-                    capture_output=True,
-                    text=True,
-                    cwd=worktree_path,
-                )
-                if install_result.returncode == 0:
-                    deps_installed = True
-                    if not output_json:
-                        success("Dependencies installed")
-                else:
-                    if not output_json:
-                        warning("Could not install dependencies — run pnpm install manually")
+            print_json(result, indent=False)
+            if "error" in result:
+                raise SystemExit(1)
+            return
+        if "error" in result:
+            _print_create_error(result)
+            raise SystemExit(1)
 
-    if output_json:
-        console.print(json.dumps({
-            "created": True,
-            "path": str(worktree_path),
-            "branch": branch_name,
-            "ref_type": ref_type,
-            "deps_installed": deps_installed,
-        }))
-    else:
         success(f"Created worktree for {ref_type} at:")
         console.print(f"  [cyan]{worktree_path}[/cyan]")
         console.print()
@@ -284,6 +531,35 @@ def worktree_create(ctx: click.Context, ref: str, write: bool, new: bool, no_ins
         console.print()
         console.print("[dim]Or open in VS Code:[/dim]")
         console.print(f"  code {worktree_path}")
+        return
+
+    # Independent worktrees: create them concurrently, report in REF order
+    if not output_json:
+        info(f"Creating {len(targets)} worktrees...")
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+        futures = {
+            ref: executor.submit(
+                _create_worktree, branch_name, base / worktree_name, ref_type,
+                new, no_install, install_async, True,
+            )
+            for worktree_name, (ref, branch_name, ref_type) in targets.items()
+        }
+        results = [
+            {"ref": ref, **(collisions[ref] if ref in collisions else futures[ref].result())}
+            for ref in order
+        ]
+
+    failed = [r for r in results if "error" in r]
+    if output_json:
+        print_json(results, indent=False)
+    else:
+        for r in results:
+            if "error" in r:
+                _print_create_error(r, prefix=f"{r['ref']}: ")
+            else:
+                success(f"{r['ref']}: [cyan]{r['path']}[/cyan] ({r['branch']})")
+    if failed:
+        raise SystemExit(1)
 
 
 @worktree.command("list")
@@ -297,18 +573,19 @@ def worktree_list(ctx: click.Context) -> None:
 
     worktrees = get_existing_worktrees()
     base = get_worktree_base()
+    base_str = str(base)
 
     if output_json:
         data = []
         for wt in worktrees:
-            is_managed = str(base) in wt.get("path", "")
+            is_managed = base_str in wt.get("path", "")
             data.append({
                 "path": wt.get("path"),
                 "branch": wt.get("branch"),
                 "head": wt.get("head"),
                 "managed": is_managed,
             })
-        console.print(json.dumps(data, indent=2))
+        print_json(data)
         return
 
     if not worktrees:
@@ -320,23 +597,24 @@ def worktree_list(ctx: click.Context) -> None:
     table.add_column("Branch", style="green")
     table.add_column("Type", style="dim")
 
+    repo_root_str = str(get_repo_root())
     for wt in worktrees:
         path = wt.get("path", "")
         branch = wt.get("branch", "")
 
         if wt.get("bare"):
             wt_type = "bare"
-        elif str(base) in path:
+        elif base_str in path:
             wt_type = "gw-managed"
-        elif path == str(get_repo_root()):
+        elif path == repo_root_str:
             wt_type = "main"
         else:
             wt_type = "external"
 
         # Shorten path for display
         display_path = path
-        if str(base) in path:
-            display_path = path.replace(str(base), f"./{WORKTREE_DIR}")
+        if base_str in path:
+            display_path = path.replace(base_str, f"./{WORKTREE_DIR}")
 
         table.add_row(display_path, branch or "(detached)", wt_type)
 
@@ -356,17 +634,22 @@ def worktree_cd(ctx: click.Context, ref: str) -> None:
         cd $(gw git worktree cd 920)
         cd $(gw git worktree cd feature-auth)
     """
-    _, worktree_name, _ = resolve_ref(ref)
-    base = get_worktree_base()
-    worktree_path = base / worktree_name
+    worktree_name, worktree_path = resolve_worktree_path(ref)
+    base = worktree_path.parent
 
     if not worktree_path.exists():
-        # Try to find by partial match
+        # Try to find by partial match, preferring prefix matches and then
+        # the alphabetically first name, so the pick doesn't depend on
+        # directory order
         if base.exists():
-            for p in base.iterdir():
-                if worktree_name in p.name:
-                    print(p)
-                    return
+            with os.scandir(base) as entries:
+                matches = [
+                    entry.name for entry in entries
+                    if worktree_name in entry.name and entry.is_dir()
+                ]
+            if matches:
+                print(base / min(matches, key=lambda n: (not n.startswith(worktree_name), n)))
+                return
 
         error(f"Worktree not found: {worktree_name}")
         raise SystemExit(1)
@@ -387,9 +670,7 @@ def worktree_open(ctx: click.Context, ref: str, editor: str) -> None:
         gw git worktree open 920
         gw git worktree open 920 --editor cursor
     """
-    _, worktree_name, _ = resolve_ref(ref)
-    base = get_worktree_base()
-    worktree_path = base / worktree_name
+    worktree_name, worktree_path = resolve_worktree_path(ref)
 
     if not worktree_path.exists():
         error(f"Worktree not found: {worktree_name}")
@@ -429,13 +710,11 @@ def worktree_remove(ctx: click.Context, ref: str, write: bool, force: bool) -> N
             console.print(f"[dim]{e.suggestion}[/dim]")
         raise SystemExit(1)
 
-    _, worktree_name, _ = resolve_ref(ref)
-    base = get_worktree_base()
-    worktree_path = base / worktree_name
+    worktree_name, worktree_path = resolve_worktree_path(ref)
 
     if not worktree_path.exists():
         if output_json:
-            console.print(json.dumps({"error": "Worktree not found"}))
+            print_json({"error": "Worktree not found"}, indent=False)
         else:
             error(f"Worktree not found: {worktree_name}")
         raise SystemExit(1)
@@ -445,19 +724,21 @@ def worktree_remove(ctx: click.Context, ref: str, write: bool, force: bool) -> N
     if force:
         cmd.append("--force")
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL,
+    )
 
     if result.returncode != 0:
         if "contains modified or untracked files" in result.stderr:
             if output_json:
-                console.print(json.dumps({"error": "Worktree has uncommitted changes", "hint": "Use --force"}))
+                print_json({"error": "Worktree has uncommitted changes", "hint": "Use --force"}, indent=False)
             else:
                 error("Worktree has uncommitted changes")
                 info("Use --force to remove anyway, or commit/stash your changes first")
             raise SystemExit(1)
         else:
             if output_json:
-                console.print(json.dumps({"error": result.stderr.strip()}))
+                print_json({"error": result.stderr.strip()}, indent=False)
             else:
                 error(f"Failed to remove: {result.stderr.strip()}")
             raise SystemExit(1)
@@ -467,7 +748,7 @@ def worktree_remove(ctx: click.Context, ref: str, write: bool, force: bool) -> N
         shutil.rmtree(worktree_path)
 
     if output_json:
-        console.print(json.dumps({"removed": worktree_name}))
+        print_json({"removed": worktree_name}, indent=False)
     else:
         success(f"Removed worktree: {worktree_name}")
 
@@ -496,10 +777,11 @@ def worktree_prune(ctx: click.Context, write: bool, merged: bool) -> None:
         raise SystemExit(1)
 
     # First, run git worktree prune to clean up stale refs
-    result = subprocess.run(
+    subprocess.run(
         ["git", "worktree", "prune"],
-        capture_output=True,
-        text=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
     removed = []
@@ -507,39 +789,61 @@ def worktree_prune(ctx: click.Context, write: bool, merged: bool) -> None:
 
     if merged and base.exists():
         # Get list of merged branches
+        # %(HEAD) marks the current branch with "*"; the default listing
+        # also prefixes branches checked out in worktrees with "+"
         merged_result = subprocess.run(
-            ["git", "branch", "--merged", "main"],
+            ["git", "branch", "--merged", "main", "--format=%(HEAD)%(refname:short)"],
             capture_output=True,
             text=True,
+            stdin=subprocess.DEVNULL,
         )
-        merged_branches = set(
-            b.strip().lstrip("* ")
-            for b in merged_result.stdout.strip().split("\n")
-            if b.strip() and not b.strip().startswith("*")
-        )
+        merged_branches = {
+            line[1:]
+            for line in merged_result.stdout.splitlines()
+            if line[:1] == " "
+        }
+
+        # Map worktree paths to their branches once, not per directory
+        wt_by_path = {wt.get("path"): wt for wt in get_existing_worktrees()}
 
         # Check each managed worktree
+        to_remove = []
         for worktree_dir in base.iterdir():
             if not worktree_dir.is_dir():
                 continue
+            wt = wt_by_path.get(str(worktree_dir))
+            if wt is not None and wt.get("branch", "") in merged_branches:
+                to_remove.append(worktree_dir)
+
+        remove_cmds = [
+            ["git", "worktree", "remove", "--force", str(worktree_dir)]
+            for worktree_dir in to_remove
+        ]
+        if len(remove_cmds) > 1 and use_shell_batch():
+            # Failures were never checked, so ";" rather than "&&"
+            subprocess.run(
+                "; ".join(shlex.join(cmd) for cmd in remove_cmds),
+                shell=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            for cmd in remove_cmds:
+                subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
 
-            # Try to determine the branch
-            worktrees = get_existing_worktrees()
-            for wt in worktrees:
-                if wt.get("path") == str(worktree_dir):
-                    branch = wt.get("branch", "")
-                    if branch in merged_branches:
-                        # Remove this worktree
-                        subprocess.run(
-                            ["git", "worktree", "remove", "--force", str(worktree_dir)],
-                            capture_output=True,
-                        )
-                        if worktree_dir.exists():
-                            shutil.rmtree(worktree_dir)
-                        removed.append(worktree_dir.name)
+        for worktree_dir in to_remove:
+            if worktree_dir.exists():
+                shutil.rmtree(worktree_dir)
+            removed.append(worktree_dir.name)
 
     if output_json:
-        console.print(json.dumps({"pruned": removed}))
+        print_json({"pruned": removed}, indent=False)
     else:
         if removed:
             success(f"Pruned {len(removed)} worktree(s):")
@@ -575,7 +879,7 @@ def worktree_clean(ctx: click.Context, write: bool, force: bool) -> None:
 
     if not base.exists():
         if output_json:
-            console.print(json.dumps({"cleaned": 0}))
+            print_json({"cleaned": 0}, indent=False)
         else:
             info("No gw-managed worktrees to clean")
         return
@@ -588,37 +892,113 @@ def worktree_clean(ctx: click.Context, write: bool, force: bool) -> None:
             console.print("[dim]Aborted[/dim]")
             raise SystemExit(0)
 
-    # Remove each worktree properly
+    # Remove each worktree properly. Removals touch separate worktree
+    # directories and admin entries, so start a batch of up to 8
+    # `git worktree remove` processes at once and then reap them; no
+    # threads needed to wait on processes.
+    worktree_dirs = [d for d in base.iterdir() if d.is_dir()]
     removed = []
-    for worktree_dir in list(base.iterdir()):
-        if not worktree_dir.is_dir():
-            continue
-
-        cmd = ["git", "worktree", "remove", str(worktree_dir)]
-        if force:
-            cmd.append("--force")
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0 and force:
-            # Force delete the directory anyway
-            shutil.rmtree(worktree_dir, ignore_errors=True)
-
-        removed.append(worktree_dir.name)
+    for i in range(0, len(worktree_dirs), 8):
+        procs = []
+        for worktree_dir in worktree_dirs[i:i + 8]:
+            cmd = ["git", "worktree", "remove", str(worktree_dir)]
+            if force:
+                cmd.append("--force")
+
+            procs.append((worktree_dir, subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )))
+
+        for worktree_dir, proc in procs:
+            if proc.wait() != 0 and force:
+                # Force delete the directory anyway
+                shutil.rmtree(worktree_dir, ignore_errors=True)
+
+            removed.append(worktree_dir.name)
 
     # Clean up the base directory if empty
     if base.exists() and not any(base.iterdir()):
         base.rmdir()
 
     # Prune any stale refs
-    subprocess.run(["git", "worktree", "prune"], capture_output=True)
+    subprocess.run(
+        ["git", "worktree", "prune"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
     if output_json:
-        console.print(json.dumps({"cleaned": len(removed), "worktrees": removed}))
+        print_json({"cleaned": len(removed), "worktrees": removed}, indent=False)
     else:
         success(f"Cleaned {len(removed)} worktree(s)")
 
 
+def _probe_worktree(
+    wt: dict,
+    repo_root_str: str,
+    base_str: str,
+    origin_refs: set[str],
+) -> dict:
+    """Collect dirty count and ahead/behind for one worktree.
+
+    Ahead/behind is only computed when the branch exists on origin
+    (`origin_refs` holds full refnames under refs/remotes/origin).
+    """
+    path = wt.get("path", "")
+    branch = wt.get("branch", "")
+    is_main = path == repo_root_str
+    is_managed = base_str in path
+
+    # Get dirty state and ahead/behind
+    dirty_count = 0
+    ahead = 0
+    behind = 0
+
+    try:
+        status_result = subprocess.run(
+            ["git", "status", "--porcelain"],
+            capture_output=True,
+            text=True,
+            cwd=path,
+            stdin=subprocess.DEVNULL,
+        )
+        if status_result.returncode == 0:
+            lines = [l for l in status_result.stdout.strip().split("\n") if l]
+            dirty_count = len(lines)
+
+        # Get ahead/behind; detached and unpushed branches have nothing
+        # to compare against, so don't spawn a rev-list that must fail
+        if branch and f"refs/remotes/origin/{branch}" in origin_refs:
+            ab_result = subprocess.run(
+                ["git", "rev-list", "--left-right", "--count",
+                 f"origin/{branch}...{branch}"],
+                capture_output=True,
+                text=True,
+                cwd=path,
+                stdin=subprocess.DEVNULL,
+            )
+            if ab_result.returncode == 0:
+                parts = ab_result.stdout.strip().split()
+                if len(parts) >= 2:
+                    behind = int(parts[0])
+                    ahead = int(parts[1])
+    except Exception:
+        pass
+
+    return {
+        "path": path,
+        "branch": branch,
+        "type": "main" if is_main else ("gw-managed" if is_managed else "external"),
+        "dirty": dirty_count,
+        "ahead": ahead,
+        "behind": behind,
+    }
+
+
 @worktree.command("status")
 @click.pass_context
 def worktree_status(ctx: click.Context) -> None:
@@ -638,63 +1018,33 @@ def worktree_status(ctx: click.Context) -> None:
 
     if not worktrees:
         if output_json:
-            console.print(json.dumps([]))
+            print_json([], indent=False)
         else:
             info("No worktrees found")
         return
 
-    statuses = []
+    repo_root_str = str(get_repo_root())
+    base_str = str(base)
 
-    for wt in worktrees:
-        path = wt.get("path", "")
-        branch = wt.get("branch", "")
-        is_main = path == str(get_repo_root())
-        is_managed = str(base) in path
-
-        # Get dirty state and ahead/behind
-        dirty_count = 0
-        ahead = 0
-        behind = 0
-
-        try:
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                cwd=path,
-            )
-            if status_result.returncode == 0:
-                lines = [l for l in status_result.stdout.strip().split("\n") if l]
-                dirty_count = len(lines)
-
-            # Get ahead/behind
-            ab_result = subprocess.run(
-                ["git", "rev-list", "--left-right", "--count",
-                 f"origin/{branch}...{branch}"],
-                capture_output=True,
-                text=True,
-                cwd=path,
-            )
-            if ab_result.returncode == 0:
-                parts = ab_result.stdout.strip().split()
-                if len(parts) >= 2:
-                    behind = int(parts[0])
-                    ahead = int(parts[1])
-        except Exception:
-            pass
+    # Worktrees share one ref store, so list origin's branches once
+    origin_result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname)", "refs/remotes/origin/"],
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+    origin_refs = set(origin_result.stdout.splitlines())
 
-        entry = {
-            "path": path,
-            "branch": branch,
-            "type": "main" if is_main else ("gw-managed" if is_managed else "external"),
-            "dirty": dirty_count,
-            "ahead": ahead,
-            "behind": behind,
-        }
-        statuses.append(entry)
+    # Each probe is up to two independent git processes, so run worktrees
+    # in parallel; map() keeps the original order
+    with ThreadPoolExecutor(max_workers=min(16, len(worktrees))) as executor:
+        statuses = list(executor.map(
+            lambda wt: _probe_worktree(wt, repo_root_str, base_str, origin_refs),
+            worktrees,
+        ))
 
     if output_json:
-        console.print(json.dumps(statuses, indent=2))
+        print_json(statuses)
         return
 
     table = Table(title="Worktree Status", border_style="green")
@@ -706,8 +1056,8 @@ def worktree_status(ctx: click.Context) -> None:
     for s in statuses:
         # Display path
         display_path = s["path"]
-        if str(base) in display_path:
-            display_path = display_path.replace(str(base), f"./{WORKTREE_DIR}")
+        if base_str in display_path:
+            display_path = display_path.replace(base_str, f"./{WORKTREE_DIR}")
         if s["type"] == "main":
             display_path = f"{display_path} (main)"
 
@@ -760,35 +1110,36 @@ def worktree_finish(ctx: click.Context, ref: str, write: bool, push: bool, delet
             console.print(f"[dim]{e.suggestion}[/dim]")
         raise SystemExit(1)
 
-    _, worktree_name, _ = resolve_ref(ref)
-    base = get_worktree_base()
-    worktree_path = base / worktree_name
+    worktree_name, worktree_path = resolve_worktree_path(ref)
 
     if not worktree_path.exists():
         error(f"Worktree not found: {worktree_name}")
         raise SystemExit(1)
 
-    # Get the branch name from the worktree
-    branch_result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+    # One status call gives both the branch name and the dirty check:
+    # porcelain v2 prints "# branch.head <name>" ahead of the entries
+    status_result = subprocess.run(
+        ["git", "status", "--porcelain=v2", "--branch"],
         capture_output=True,
         text=True,
+        stdin=subprocess.DEVNULL,
         cwd=worktree_path,
     )
-    if branch_result.returncode != 0:
+    if status_result.returncode != 0:
         error("Could not determine branch in worktree")
         raise SystemExit(1)
 
-    branch_name = branch_result.stdout.strip()
+    branch_name = "HEAD"
+    dirty_files = []
+    for line in status_result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            if head != "(detached)":
+                branch_name = head
+        elif line and not line.startswith("#"):
+            dirty_files.append(line)
 
     # SAFETY: Check for uncommitted changes
-    status_result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True,
-        text=True,
-        cwd=worktree_path,
-    )
-    dirty_files = [l for l in status_result.stdout.strip().split("\n") if l]
     if dirty_files:
         error(f"Worktree has {len(dirty_files)} uncommitted file(s)")
         console.print(
@@ -801,15 +1152,20 @@ def worktree_finish(ctx: click.Context, ref: str, write: bool, push: bool, delet
     if not output_json:
         console.print(f"[dim]Finishing worktree: {worktree_name} (branch: {branch_name})[/dim]")
 
-    # Step 1: Push if requested
+    # Step 1: Push if requested. It runs inside the worktree and finishes
+    # before removal, so pre-push hooks see the branch being finished.
     pushed = False
-    if push:
+    if push and branch_name == "HEAD":
+        if not output_json:
+            warning("Push skipped: worktree is on a detached HEAD")
+    elif push:
         if not output_json:
             info(f"Pushing {branch_name} to origin...")
         push_result = subprocess.run(
             ["git", "push", "-u", "origin", branch_name],
             capture_output=True,
             text=True,
+            stdin=subprocess.DEVNULL,
             cwd=worktree_path,
         )
         if push_result.returncode == 0:
@@ -826,6 +1182,7 @@ def worktree_finish(ctx: click.Context, ref: str, write: bool, push: bool, delet
         ["git", "worktree", "remove", str(worktree_path)],
         capture_output=True,
         text=True,
+        stdin=subprocess.DEVNULL,
     )
     if remove_result.returncode != 0:
         error(f"Failed to remove worktree: {remove_result.stderr.strip()}")
@@ -845,6 +1202,7 @@ def worktree_finish(ctx: click.Context, ref: str, write: bool, push: bool, delet
             ["git", "branch", "-d", branch_name],
             capture_output=True,
             text=True,
+            stdin=subprocess.DEVNULL,
         )
         if del_result.returncode == 0:
             branch_deleted = True
@@ -855,13 +1213,13 @@ def worktree_finish(ctx: click.Context, ref: str, write: bool, push: bool, delet
                 warning(f"Could not delete branch (may not be merged): {del_result.stderr.strip()}")
 
     if output_json:
-        console.print(json.dumps({
+        print_json({
             "finished": True,
             "worktree": worktree_name,
             "branch": branch_name,
             "pushed": pushed,
             "branch_deleted": branch_deleted,
-        }))
+        }, indent=False)
     else:
         console.print()
         success("Done! Worktree cleaned up.")
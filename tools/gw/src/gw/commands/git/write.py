@@ -1,7 +1,5 @@
 """Write Git commands (Tier 2 - Require --write flag)."""
 
-import json
-import os
 from typing import Optional
 
 import click
@@ -10,14 +8,17 @@ from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
-from ...git_wrapper import Git, GitError
+from ...git_wrapper import GitError, get_git
+from ...json_output import print_json
 from ...safety.git import (
+    DEFAULT_GIT_SAFETY_CONFIG,
     GitSafetyConfig,
     GitSafetyError,
     check_git_safety,
     extract_issue_number,
     format_conventional_commit,
     is_agent_mode,
+    stdin_is_tty,
     validate_conventional_commit,
 )
 
@@ -62,7 +63,7 @@ def add(ctx: click.Context, write: bool, all_files: bool, paths: tuple[str, ...]
         raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -71,7 +72,7 @@ def add(ctx: click.Context, write: bool, all_files: bool, paths: tuple[str, ...]
         # If staging all, confirm with user
         if all_files or (len(paths) == 1 and paths[0] == "."):
             status = git.status()
-            total_changes = len(status.unstaged) + len(status.untracked)
+            total_changes = status.dirty_count
 
             if total_changes == 0:
                 console.print("[dim]No changes to stage[/dim]")
@@ -85,7 +86,7 @@ def add(ctx: click.Context, write: bool, all_files: bool, paths: tuple[str, ...]
         git.add(list(paths), all_files=all_files)
 
         if output_json:
-            console.print(json.dumps({"staged": list(paths) if paths else ["all"]}))
+            print_json({"staged": list(paths) if paths else ["all"]}, indent=False)
         else:
             if all_files:
                 console.print("[green]Staged all changes[/green]")
@@ -123,7 +124,7 @@ def unstage(ctx: click.Context, write: bool, all_files: bool, paths: tuple[str,
         raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -138,7 +139,7 @@ def unstage(ctx: click.Context, write: bool, all_files: bool, paths: tuple[str,
             git.execute(["reset", "HEAD", "--"] + list(paths))
 
         if output_json:
-            console.print(json.dumps({"unstaged": list(paths) if paths else ["all"]}))
+            print_json({"unstaged": list(paths) if paths else ["all"]}, indent=False)
         else:
             console.print("[green]Files unstaged[/green]")
 
@@ -188,20 +189,20 @@ def commit(
         raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
-        # Check for staged changes
-        status = git.status()
-        if not status.staged:
+        # Check for staged changes; diff --cached only compares the index
+        # with HEAD, unlike a full status walk of the working tree
+        if not git.has_staged_changes():
             console.print("[yellow]No staged changes to commit[/yellow]")
             console.print("[dim]Use 'gw git add --write <files>' to stage changes[/dim]")
             raise SystemExit(1)
 
-        config = GitSafetyConfig()
+        config = DEFAULT_GIT_SAFETY_CONFIG
 
         # Auto-detect issue from branch name
         if issue is None and config.auto_link_issues:
@@ -215,9 +216,8 @@ def commit(
         # Add issue reference if not already present
         if issue and f"#{issue}" not in message:
             # Append to first line
-            lines = message.split("\n")
-            lines[0] = f"{lines[0]} (#{issue})"
-            message = "\n".join(lines)
+            first_line, newline, rest = message.partition("\n")
+            message = f"{first_line} (#{issue}){newline}{rest}"
 
         # Validate conventional commit format
         valid, error = validate_conventional_commit(message, config)
@@ -229,13 +229,13 @@ def commit(
         commit_hash = git.commit(message, no_verify=no_verify)
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "hash": commit_hash,
                 "message": message,
                 "issue": issue,
-            }))
+            }, indent=False)
         else:
-            console.print(f"[green]Committed:[/green] {message.split(chr(10))[0]}")
+            console.print(f"[green]Committed:[/green] {message.partition(chr(10))[0]}")
             console.print(f"[dim]Hash: {commit_hash[:8]}[/dim]")
             if issue:
                 console.print(f"[dim]Linked to issue #{issue}[/dim]")
@@ -336,26 +336,32 @@ def push(
         raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
-        current_branch = branch or git.current_branch()
+        # -u needs an explicit branch; otherwise git resolves HEAD itself
+        # and the name is only looked up for the report, after a
+        # successful push
+        if set_upstream and not branch:
+            branch = git.current_branch()
 
         git.push(
             remote=remote,
-            branch=current_branch if set_upstream else branch,
+            branch=branch,
             force_with_lease=use_force_with_lease,
             set_upstream=set_upstream,
         )
 
+        current_branch = branch or git.current_branch()
+
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "remote": remote,
                 "branch": current_branch,
-            }))
+            }, indent=False)
         else:
             console.print(f"[green]Pushed to {remote}/{current_branch}[/green]")
 
@@ -422,7 +428,7 @@ def pull(
         raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -433,11 +439,11 @@ def pull(
         git.pull(remote=remote, branch=current_branch, rebase=rebase)
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "remote": remote,
                 "branch": current_branch,
                 "rebase": rebase,
-            }))
+            }, indent=False)
         else:
             console.print(f"[green]Pulled from {remote}/{current_branch}[/green]")
             if rebase:
@@ -490,7 +496,7 @@ def branch(
     output_json = ctx.obj.get("output_json", False)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -500,22 +506,29 @@ def branch(
         if list_branches or (not name and not delete):
             check_git_safety("branch_list", write_flag=True)  # Always allowed
 
-            output = git.execute(["branch", "-a", "-v"])
-
             if output_json:
+                # NUL-separated fields instead of scraping the padded -v
+                # listing, whose "->" symref lines have no hash
+                output = git.execute([
+                    "branch", "-a",
+                    "--format=%(HEAD)%00%(refname)%00%(objectname:short)",
+                ])
                 branches = []
-                for line in output.strip().split("\n"):
-                    if line.strip():
-                        is_current = line.startswith("*")
-                        parts = line.lstrip("* ").split()
-                        branches.append({
-                            "name": parts[0],
-                            "hash": parts[1] if len(parts) > 1 else "",
-                            "current": is_current,
-                        })
-                console.print(json.dumps({"branches": branches}))
+                for line in output.splitlines():
+                    head, _, rest = line.partition("\0")
+                    refname, _, short_hash = rest.partition("\0")
+                    if refname.startswith("refs/heads/"):
+                        refname = refname[len("refs/heads/"):]
+                    elif refname.startswith("refs/"):
+                        refname = refname[len("refs/"):]
+                    branches.append({
+                        "name": refname,
+                        "hash": short_hash,
+                        "current": head == "*",
+                    })
+                print_json({"branches": branches}, indent=False)
             else:
-                console.print(output)
+                console.print(git.execute(["branch", "-a", "-v"]))
             return
 
         # Create or delete branch
@@ -536,13 +549,13 @@ def branch(
         if delete:
             git.branch_delete(name)
             if output_json:
-                console.print(json.dumps({"deleted": name}))
+                print_json({"deleted": name}, indent=False)
             else:
                 console.print(f"[green]Deleted branch: {name}[/green]")
         else:
             git.branch_create(name, start_point)
             if output_json:
-                console.print(json.dumps({"created": name}))
+                print_json({"created": name}, indent=False)
             else:
                 console.print(f"[green]Created branch: {name}[/green]")
                 console.print(f"[dim]Switch with: gw git switch {name}[/dim]")
@@ -576,7 +589,7 @@ def switch(ctx: click.Context, branch_name: str, create: bool) -> None:
         else:
             check_git_safety("branch_list", write_flag=True)  # Read-only allowed
 
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -585,7 +598,7 @@ def switch(ctx: click.Context, branch_name: str, create: bool) -> None:
         git.switch(branch_name, create=create)
 
         if output_json:
-            console.print(json.dumps({"branch": branch_name}))
+            print_json({"branch": branch_name}, indent=False)
         else:
             console.print(f"[green]Switched to branch: {branch_name}[/green]")
 
@@ -657,7 +670,7 @@ def stash(
     output_json = ctx.obj.get("output_json", False)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -668,7 +681,7 @@ def stash(
             stashes = git.stash_list()
 
             if output_json:
-                console.print(json.dumps({"stashes": stashes}))
+                print_json({"stashes": stashes}, indent=False)
             else:
                 if not stashes:
                     console.print("[dim]No stashes[/dim]")
@@ -703,19 +716,19 @@ def stash(
         if pop:
             git.stash_pop(index)
             if output_json:
-                console.print(json.dumps({"popped": index}))
+                print_json({"popped": index}, indent=False)
             else:
                 console.print(f"[green]Popped stash@{{{index}}}[/green]")
         elif apply_stash:
             git.stash_apply(index)
             if output_json:
-                console.print(json.dumps({"applied": index}))
+                print_json({"applied": index}, indent=False)
             else:
                 console.print(f"[green]Applied stash@{{{index}}}[/green]")
         elif drop:
             git.stash_drop(index)
             if output_json:
-                console.print(json.dumps({"dropped": index}))
+                print_json({"dropped": index}, indent=False)
             else:
                 console.print(f"[green]Dropped stash@{{{index}}}[/green]")
         else:
@@ -723,7 +736,7 @@ def stash(
             # AI agents should NEVER stash user WIP to work around
             # sync/push failures. The user decides what happens to
             # their working tree.
-            if not os.isatty(0):
+            if not stdin_is_tty() or is_agent_mode():
                 console.print(
                     "[bold red]AGENT SAFETY BLOCK:[/bold red] "
                     "Stashing is not allowed from non-interactive contexts.\n"
@@ -737,7 +750,7 @@ def stash(
             # Push to stash
             git.stash_push(message)
             if output_json:
-                console.print(json.dumps({"stashed": True, "message": message}))
+                print_json({"stashed": True, "message": message}, indent=False)
             else:
                 console.print("[green]Stashed changes[/green]")
                 if message:
@@ -773,33 +786,43 @@ def cherry_pick(ctx: click.Context, write: bool, commits: tuple[str, ...]) -> No
         raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
             raise SystemExit(1)
 
-        # Validate commits exist before attempting cherry-pick
-        for commit_ref in commits:
-            try:
-                git.execute(["cat-file", "-t", commit_ref])
-            except GitError:
+        # Validate commits exist before attempting cherry-pick, all in
+        # one cat-file call. ^{commit} peels tags to the commits they
+        # point at and rejects refs naming trees or blobs.
+        peeled = [f"{commit_ref}^{{commit}}" for commit_ref in commits]
+        resolved = git.cat_file_batch_check(peeled)
+        hashes = [resolved.get(ref) for ref in peeled]
+        for commit_ref, commit_hash in zip(commits, hashes):
+            if commit_hash is None:
                 console.print(f"[red]Commit not found:[/red] {commit_ref}")
                 console.print("[dim]Verify the commit hash exists with: gw git log[/dim]")
                 raise SystemExit(1)
 
-        # Apply cherry-pick
-        applied = []
-        for commit_ref in commits:
-            git.execute(["cherry-pick", commit_ref])
-            short_hash = git.execute(["rev-parse", "--short", commit_ref]).strip()
-            applied.append(short_hash)
+        # git de-duplicates the revisions it is given, so a commit named
+        # twice is applied once; pass and report each commit once too
+        unique_hashes = list(dict.fromkeys(hashes))
+
+        # Abbreviate every hash in one call; --no-walk=unsorted keeps the
+        # argument order
+        applied = git.execute(
+            ["log", "--no-walk=unsorted", "--format=%h", *unique_hashes]
+        ).split()
+
+        # Apply all commits in one sequencer run; git keeps the given
+        # order, and on conflict --continue picks up the remaining ones
+        git.execute(["cherry-pick", *unique_hashes])
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "cherry_picked": applied,
                 "count": len(applied),
-            }))
+            }, indent=False)
         else:
             for h in applied:
                 console.print(f"[green]Cherry-picked:[/green] {h}")
@@ -857,7 +880,7 @@ def restore(
         raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -882,11 +905,11 @@ def restore(
         git.execute(args)
 
         if output_json:
-            console.print(json.dumps({
+            print_json({
                 "restored": list(paths),
                 "staged": staged,
                 "source": source,
-            }))
+            }, indent=False)
         else:
             action = "Unstaged" if staged else "Restored"
             console.print(f"[green]{action} {len(paths)} path(s)[/green]")
@@ -943,7 +966,7 @@ def clean(
             raise SystemExit(1)
 
     try:
-        git = Git()
+        git = get_git()
 
         if not git.is_repo():
             console.print("[red]Not a git repository[/red]")
@@ -969,11 +992,11 @@ def clean(
                 for line in output.strip().split("\n")
                 if line.strip()
             ]
-            console.print(json.dumps({
+            print_json({
                 "dry_run": dry_run,
                 "files": files,
                 "count": len(files),
-            }))
+            }, indent=False)
         else:
             if dry_run:
                 lines = [l for l in output.strip().split("\n") if l.strip()]
@@ -1,12 +1,18 @@
 """Wrapper for Git subprocess operations."""
 
+import functools
 import json
 import os
 import re
+import shlex
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+# Issue number in a branch name: a number followed by dash or underscore,
+# at the start or right after a slash
+_ISSUE_BRANCH_RE = re.compile(r"(?:^|/)(\d+)[-_]")
 
 
 class GitError(Exception):
@@ -26,6 +32,48 @@ class GitError(Exception):
         super().__init__(message)
 
 
+def use_shell_batch() -> bool:
+    """Check whether multi-step commands may run as one shell invocation.
+
+    Set GW_NO_SHELL_BATCH to fall back to one subprocess per git command.
+    Always off on Windows, which has no POSIX shell.
+    """
+    return os.name != "nt" and not os.environ.get("GW_NO_SHELL_BATCH")
+
+
+def _git_error(message: str, e: subprocess.CalledProcessError) -> GitError:
+    """Build a GitError from a failed text-mode subprocess."""
+    stderr_text = (e.stderr or "").strip()
+    stdout_text = (e.stdout or "").strip()
+    msg = message
+    if stderr_text:
+        msg += f"\n{stderr_text}"
+    # Include stdout in error output — git hooks (pre-push, pre-commit)
+    # write their diagnostics to stdout, which is captured separately.
+    # Without this, hook failures are invisible to error handlers.
+    combined = e.stderr or ""
+    if stdout_text:
+        combined = f"{combined}\n{e.stdout}" if combined.strip() else e.stdout
+    return GitError(msg, returncode=e.returncode, stderr=combined)
+
+
+@functools.lru_cache(maxsize=8)
+def _git_for_dir(cwd: str) -> "Git":
+    return Git(Path(cwd))
+
+
+def get_git() -> "Git":
+    """Get a shared Git wrapper for the current working directory.
+
+    Instances are memoized per resolved cwd, so repeated lookups in one
+    process reuse the cached repository probe and remotes.
+
+    Returns:
+        Git wrapper rooted at the current working directory
+    """
+    return _git_for_dir(os.path.realpath(os.getcwd()))
+
+
 @dataclass
 class GitStatus:
     """Parsed git status information."""
@@ -40,6 +88,21 @@ class GitStatus:
     is_detached: bool
     upstream: Optional[str]
 
+    @property
+    def staged_paths(self) -> list[str]:
+        """Paths with staged changes."""
+        return [path for _, path in self.staged]
+
+    @property
+    def unstaged_paths(self) -> list[str]:
+        """Paths with unstaged changes (including unmerged)."""
+        return [path for _, path in self.unstaged]
+
+    @property
+    def dirty_count(self) -> int:
+        """Number of paths with unstaged or untracked changes."""
+        return len(self.unstaged) + len(self.untracked)
+
 
 @dataclass
 class GitCommit:
@@ -74,6 +137,10 @@ class Git:
         """
         self.working_dir = working_dir or Path.cwd()
         self._version_cache: Optional[str] = None
+        self._remotes_cache: Optional[dict[str, str]] = None
+        self._is_repo_cache: Optional[bool] = None
+        self.git_dir: Optional[str] = None
+        self.is_inside_work_tree = False
 
     def is_installed(self) -> bool:
         """Check if Git is installed."""
@@ -88,13 +155,26 @@ class Git:
             return False
 
     def is_repo(self) -> bool:
-        """Check if current directory is a git repository."""
+        """Check if current directory is a git repository.
+
+        The repository layout is probed once with a single rev-parse and
+        cached, along with git_dir and is_inside_work_tree.
+        """
+        if self._is_repo_cache is not None:
+            return self._is_repo_cache
+
         try:
-            self.execute(["rev-parse", "--git-dir"])
-            return True
+            output = self.execute(["rev-parse", "--git-dir", "--is-inside-work-tree"])
         except GitError:
+            self._is_repo_cache = False
             return False
 
+        lines = output.splitlines()
+        self.git_dir = lines[0] if lines else None
+        self.is_inside_work_tree = len(lines) > 1 and lines[1] == "true"
+        self._is_repo_cache = True
+        return True
+
     def get_version(self) -> str:
         """Get Git version string."""
         if self._version_cache is not None:
@@ -112,6 +192,7 @@ class Git:
         capture_output: bool = True,
         check: bool = True,
         env: Optional[dict[str, str]] = None,
+        input: Optional[str] = None,
     ) -> str:
         """Execute a Git command.
 
@@ -120,6 +201,7 @@ class Git:
             capture_output: Capture stdout/stderr
             check: Raise on non-zero exit
             env: Additional environment variables
+            input: Text to write to the command's stdin
 
         Returns:
             Command output (stdout)
@@ -127,12 +209,13 @@ class Git:
         Raises:
             GitError: If command fails and check=True
         """
-        cmd = ["git"] + args
+        cmd = ["git", *args]
 
-        # Merge environment
-        run_env = os.environ.copy()
+        # Only build a merged environment when there are overrides;
+        # env=None lets the child inherit os.environ without a copy.
+        run_env = None
         if env:
-            run_env.update(env)
+            run_env = {**os.environ, **env}
 
         try:
             result = subprocess.run(
@@ -142,25 +225,64 @@ class Git:
                 check=check,
                 cwd=self.working_dir,
                 env=run_env,
+                input=input,
             )
             return result.stdout if capture_output else ""
         except subprocess.CalledProcessError as e:
-            stderr_text = (e.stderr or "").strip()
-            stdout_text = (e.stdout or "").strip()
-            msg = f"Git command failed: {' '.join(cmd)}"
-            if stderr_text:
-                msg += f"\n{stderr_text}"
-            # Include stdout in error output — git hooks (pre-push, pre-commit)
-            # write their diagnostics to stdout, which is captured separately.
-            # Without this, hook failures are invisible to error handlers.
-            combined = e.stderr or ""
-            if stdout_text:
-                combined = f"{combined}\n{e.stdout}" if combined.strip() else e.stdout
-            raise GitError(
-                msg,
-                returncode=e.returncode,
-                stderr=combined,
-            ) from e
+            raise _git_error(f"Git command failed: {' '.join(cmd)}", e) from e
+
+    def cat_file_batch_check(self, refs: list[str]) -> dict[str, Optional[str]]:
+        """Resolve several object names with one `git cat-file --batch-check`.
+
+        Args:
+            refs: Commit hashes, branch names, or other revisions
+
+        Returns:
+            Mapping of each ref to its full object name, or None if it
+            doesn't name an object (missing or ambiguous)
+        """
+        if not refs:
+            return {}
+        output = self.execute(
+            ["cat-file", "--batch-check=%(objectname)"],
+            input="".join(f"{ref}\n" for ref in refs),
+        )
+        # Found objects print just the hash; failures echo the ref
+        # followed by "missing" or "ambiguous"
+        return {
+            ref: line if " " not in line else None
+            for ref, line in zip(refs, output.splitlines())
+        }
+
+    def execute_chain(self, commands: list[list[str]]) -> str:
+        """Execute several Git commands in a single shell invocation.
+
+        Commands are joined with `&&`, so execution stops at the first
+        failure. Every argument is shell-quoted.
+
+        Args:
+            commands: List of command argument lists (each without 'git')
+
+        Returns:
+            Combined stdout of the commands that ran
+
+        Raises:
+            GitError: If any command in the chain fails
+        """
+        script = " && ".join(shlex.join(["git", *args]) for args in commands)
+
+        try:
+            result = subprocess.run(
+                script,
+                shell=True,
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=self.working_dir,
+            )
+            return result.stdout
+        except subprocess.CalledProcessError as e:
+            raise _git_error(f"Git command failed: {script}", e) from e
 
     def status(self) -> GitStatus:
         """Get repository status.
@@ -168,8 +290,9 @@ class Git:
         Returns:
             GitStatus with parsed status information
         """
-        # Get porcelain status for machine parsing
-        output = self.execute(["status", "--porcelain=v2", "--branch"])
+        # NUL-terminated porcelain v2: paths arrive verbatim (no C-style
+        # quoting) and may contain spaces
+        output = self.execute(["status", "--porcelain=v2", "--branch", "-z"])
 
         branch = "HEAD"
         ahead = 0
@@ -180,28 +303,35 @@ class Git:
         unstaged: list[tuple[str, str]] = []
         untracked: list[str] = []
 
-        for line in output.strip().split("\n"):
+        entries = iter(output.split("\0"))
+        for line in entries:
             if not line:
                 continue
 
-            if line.startswith("# branch.head"):
-                branch = line.split()[-1]
-                is_detached = branch == "(detached)"
-            elif line.startswith("# branch.upstream"):
-                upstream = line.split()[-1]
-            elif line.startswith("# branch.ab"):
-                # Parse "+N -M" format
-                parts = line.split()
-                for part in parts[2:]:
-                    if part.startswith("+"):
-                        ahead = int(part[1:])
-                    elif part.startswith("-"):
-                        behind = int(part[1:])
-            elif line.startswith("1 ") or line.startswith("2 "):
-                # Changed entry
-                parts = line.split()
-                xy = parts[1]
-                path = parts[-1]
+            kind = line[0]
+            if kind == "#":
+                if line.startswith("# branch.head"):
+                    branch = line.split()[-1]
+                    is_detached = branch == "(detached)"
+                elif line.startswith("# branch.upstream"):
+                    upstream = line.split()[-1]
+                elif line.startswith("# branch.ab"):
+                    # Parse "+N -M" format
+                    parts = line.split()
+                    for part in parts[2:]:
+                        if part.startswith("+"):
+                            ahead = int(part[1:])
+                        elif part.startswith("-"):
+                            behind = int(part[1:])
+            elif kind == "1" or kind == "2":
+                # Changed entry: "1 XY sub mH mI mW hH hI path"; renames
+                # and copies ("2") carry an extra score field, and their
+                # original path follows as a separate NUL-terminated entry
+                fields = line.split(" ", 8 if kind == "1" else 9)
+                xy = fields[1]
+                path = fields[-1]
+                if kind == "2":
+                    next(entries, None)
 
                 # X = staged status, Y = unstaged status
                 x_status = xy[0]
@@ -211,13 +341,12 @@ class Git:
                     staged.append((x_status, path))
                 if y_status != ".":
                     unstaged.append((y_status, path))
-            elif line.startswith("? "):
+            elif kind == "?":
                 # Untracked file
                 untracked.append(line[2:])
-            elif line.startswith("u "):
+            elif kind == "u":
                 # Unmerged entry - treat as unstaged
-                parts = line.split()
-                path = parts[-1]
+                path = line.split(" ", 10)[-1]
                 unstaged.append(("U", path))
 
         is_clean = not staged and not unstaged and not untracked
@@ -234,6 +363,96 @@ class Git:
             upstream=upstream,
         )
 
+    def execute_bytes(self, args: list[str]) -> bytes:
+        """Execute a Git command and return its stdout undecoded.
+
+        For NUL-delimited output that is split before decoding, so each
+        field is decoded once and a stray invalid byte only affects it.
+
+        Args:
+            args: Command arguments (without 'git')
+
+        Returns:
+            Raw stdout bytes
+
+        Raises:
+            GitError: If the command fails
+        """
+        cmd = ["git", *args]
+        result = subprocess.run(cmd, capture_output=True, cwd=self.working_dir)
+        if result.returncode != 0:
+            stderr_text = result.stderr.decode(errors="replace")
+            raise GitError(
+                f"Git command failed: {' '.join(cmd)}\n{stderr_text.strip()}",
+                returncode=result.returncode,
+                stderr=stderr_text,
+            )
+        return result.stdout
+
+    def status_porcelain_raw(self) -> bytes:
+        """Get unparsed `git status --porcelain=v2 -z --branch` output.
+
+        For machine consumers that want git's own format, this skips the
+        GitStatus parser entirely.
+
+        Returns:
+            Raw NUL-delimited porcelain v2 bytes
+
+        Raises:
+            GitError: If the status command fails
+        """
+        return self.execute_bytes(["status", "--porcelain=v2", "-z", "--branch"])
+
+    def iter_tags(
+        self, sort: str = "-version:refname", limit: Optional[int] = None
+    ) -> Iterator[tuple[str, str, str]]:
+        """Iterate over tags with their date and subject.
+
+        Args:
+            sort: for-each-ref sort key
+            limit: Maximum number of tags to yield (applied by git)
+
+        Yields:
+            (name, date, message) tuples
+        """
+        args = [
+            "for-each-ref",
+            f"--sort={sort}",
+            "--format=%(refname:short)%00%(creatordate:relative)%00%(subject)%00",
+        ]
+        if limit:
+            args.append(f"--count={limit}")
+        args.append("refs/tags/")
+
+        output = self.execute_bytes(args)
+
+        # Each record is three NUL-terminated fields followed by a newline
+        for record in output.split(b"\0\n"):
+            if not record:
+                continue
+            name, _, rest = record.partition(b"\0")
+            date, _, message = rest.partition(b"\0")
+            yield (
+                name.decode(errors="replace"),
+                date.decode(errors="replace"),
+                message.decode(errors="replace"),
+            )
+
+    def tags(self, sort: str = "-version:refname", limit: Optional[int] = None) -> list[dict[str, str]]:
+        """List tags with their date and subject.
+
+        Args:
+            sort: for-each-ref sort key
+            limit: Maximum number of tags to return (applied by git)
+
+        Returns:
+            List of tag dicts with name, date, and message
+        """
+        return [
+            {"name": name, "date": date, "message": message}
+            for name, date, message in self.iter_tags(sort=sort, limit=limit)
+        ]
+
     def log(
         self,
         limit: int = 10,
@@ -256,7 +475,12 @@ class Git:
         Returns:
             List of GitCommit objects
         """
-        args = ["log", f"-{limit}"]
+        # A single-commit lookup (amend/undo) goes through rev-list, which
+        # skips log's pretty-printing and decoration setup
+        if limit == 1:
+            args = ["rev-list", "--max-count=1"]
+        else:
+            args = ["log", f"-{limit}"]
 
         # Use JSON-like format for parsing
         if not format_string:
@@ -269,6 +493,8 @@ class Git:
             args.append(f"--author={author}")
         if since:
             args.append(f"--since={since}")
+        if limit == 1:
+            args.append("HEAD")
         if file_path:
             args.extend(["--", file_path])
 
@@ -277,6 +503,9 @@ class Git:
 
         for entry in output.split("\x1e"):
             entry = entry.strip()
+            # rev-list prefixes each entry with a "commit <hash>" line
+            if entry.startswith("commit "):
+                entry = entry.partition("\n")[2]
             if not entry:
                 continue
 
@@ -442,14 +671,165 @@ class Git:
         except GitError:
             return None
 
-    def is_dirty(self) -> bool:
+    def remotes(self) -> dict[str, str]:
+        """Get configured remotes and their fetch URLs.
+
+        The result is cached on this instance; the remote_* helpers
+        below invalidate it.
+
+        Returns:
+            Mapping of remote name to URL, in git's listing order
+        """
+        if self._remotes_cache is not None:
+            return self._remotes_cache
+
+        output = self.execute(["remote", "-v"])
+
+        # Parse remote -v output: "name\turl (fetch/push)"
+        # Each remote appears twice (fetch + push); keep the first URL
+        remotes: dict[str, str] = {}
+        for line in output.splitlines():
+            name, tab, url_and_type = line.partition("\t")
+            if not tab:
+                continue
+            remotes.setdefault(name, url_and_type.rpartition(" ")[0])
+
+        self._remotes_cache = remotes
+        return remotes
+
+    def remote_add(self, name: str, url: str) -> None:
+        """Add a remote.
+
+        Args:
+            name: Remote name
+            url: Remote URL
+        """
+        self.execute(["remote", "add", name, url])
+        self._remotes_cache = None
+
+    def remote_remove(self, name: str) -> None:
+        """Remove a remote.
+
+        Args:
+            name: Remote name
+        """
+        self.execute(["remote", "remove", name])
+        self._remotes_cache = None
+
+    def remote_rename(self, old_name: str, new_name: str) -> None:
+        """Rename a remote.
+
+        Args:
+            old_name: Current remote name
+            new_name: New remote name
+        """
+        self.execute(["remote", "rename", old_name, new_name])
+        self._remotes_cache = None
+
+    def is_dirty(self, include_staged: bool = True) -> bool:
         """Check if working tree has changes.
 
+        Uses `diff-index --quiet` (or `diff-files --quiet` for unstaged
+        changes only) plus an untracked-file listing rather than a full
+        status scan. The plumbing diff does not refresh the index, so a
+        file whose stat data changed but whose content did not may be
+        reported dirty; callers that need exact results should confirm
+        with status().
+
+        Args:
+            include_staged: Count staged changes as dirty
+
         Returns:
             True if there are uncommitted changes
         """
-        status = self.status()
-        return not status.is_clean
+        if include_staged:
+            diff_args = ["diff-index", "--quiet", "HEAD", "--"]
+        else:
+            diff_args = ["diff-files", "--quiet"]
+
+        try:
+            self.execute(diff_args)
+        except GitError as e:
+            if e.returncode == 1:
+                return True
+            # No HEAD to compare against yet (unborn branch)
+            status = self.status()
+            if include_staged:
+                return not status.is_clean
+            return bool(status.unstaged or status.untracked)
+
+        untracked = self.execute(
+            ["ls-files", "--others", "--exclude-standard", "--directory", "--no-empty-directory"]
+        )
+        return bool(untracked.strip())
+
+    def has_any_change(self) -> bool:
+        """Check for any staged, unstaged, or untracked change.
+
+        Streams `git status --porcelain -z` and stops at the first byte
+        instead of waiting for the full listing. Runs with
+        --no-optional-locks so killing git early cannot leave a stale
+        index.lock behind. stderr is discarded so an undrained pipe can't
+        stall git; a failed probe is re-run to get the error text.
+
+        Returns:
+            True if the working tree or index differs from HEAD
+
+        Raises:
+            GitError: If git status fails
+        """
+        cmd = [
+            "git", "--no-optional-locks", "status",
+            "--porcelain", "-z", "--untracked-files=normal",
+        ]
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.working_dir,
+        ) as proc:
+            if proc.stdout.read(1):
+                proc.kill()
+                return True
+            if proc.wait() == 0:
+                return False
+        # Raises GitError with git's stderr, unless the failure was transient
+        return bool(self.execute(cmd[1:]))
+
+    def has_staged_changes(self) -> bool:
+        """Check whether the index differs from HEAD.
+
+        Returns:
+            True if there are staged changes
+        """
+        try:
+            self.execute(["diff", "--cached", "--quiet"])
+            return False
+        except GitError as e:
+            if e.returncode == 1:
+                return True
+            raise
+
+    def staged_count(self) -> int:
+        """Count files staged for commit.
+
+        Returns:
+            Number of paths that differ between the index and HEAD
+        """
+        output = self.execute(["diff", "--cached", "--name-only"])
+        return len(output.splitlines())
+
+    def staged_paths(self) -> list[str]:
+        """List paths staged for commit.
+
+        Cheaper than status() when only the index matters: it neither
+        scans for untracked files nor computes upstream tracking.
+
+        Returns:
+            Paths that differ between the index and HEAD, verbatim
+        """
+        output = self.execute(["diff", "--cached", "--name-only", "-z"])
+        return [path for path in output.split("\0") if path]
 
     def add(self, paths: list[str], all_files: bool = False) -> None:
         """Stage files for commit.
@@ -581,6 +961,19 @@ class Git:
         flag = "-D" if force else "-d"
         self.execute(["branch", flag, name])
 
+    def delete_tags(self, names: list[str]) -> None:
+        """Delete local tags in a single git process.
+
+        `git tag -d` accepts any number of names, so batch cleanup costs
+        one fork regardless of count. Unlike `update-ref --stdin`, it
+        still fails on a name that does not exist.
+
+        Args:
+            names: Tag names to delete
+        """
+        if names:
+            self.execute(["tag", "-d", *names])
+
     def checkout(self, ref: str, create: bool = False) -> None:
         """Checkout a branch or commit.
 
@@ -641,23 +1034,18 @@ class Git:
             List of stash entries
         """
         try:
-            output = self.execute(["stash", "list"])
+            # NUL-separated "stash@{N}" selector and reflog subject; -z
+            # also ends each entry with a NUL, so fields pair up in order
+            output = self.execute(["stash", "list", "-z", "--format=%gd%x00%gs"])
         except GitError:
             return []
 
-        stashes = []
-        for line in output.strip().split("\n"):
-            if not line:
-                continue
-            # Parse "stash@{0}: WIP on main: abc123 message"
-            match = re.match(r"stash@\{(\d+)\}: (.+)", line)
-            if match:
-                stashes.append({
-                    "index": int(match.group(1)),
-                    "description": match.group(2),
-                })
-
-        return stashes
+        fields = output.split("\0")
+        return [
+            # Selector is "stash@{N}"
+            {"index": int(selector[7:-1]), "description": description}
+            for selector, description in zip(fields[::2], fields[1::2])
+        ]
 
     def stash_drop(self, index: int = 0) -> None:
         """Drop a stash.
@@ -770,8 +1158,7 @@ class Git:
         if branch is None:
             branch = self.current_branch()
 
-        # Pattern: number followed by dash or at start after slash
-        match = re.search(r"(?:^|/)(\d+)[-_]", branch)
+        match = _ISSUE_BRANCH_RE.search(branch)
         if match:
             return int(match.group(1))
 
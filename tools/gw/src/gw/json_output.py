@@ -0,0 +1,56 @@
+"""Fast JSON output for machine-readable (--json) command paths."""
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is the optional "fast" extra — fall back to the stdlib
+    orjson = None
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and the stdlib json module otherwise.
+    Both produce the same layout.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON document (no trailing newline)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def print_json(data: Any, indent: bool = True) -> None:
+    """Write data as JSON straight to stdout, bypassing Rich rendering.
+
+    Rich would otherwise parse the document for markup and wrap long lines
+    at the terminal width, neither of which is wanted for machine output.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation
+    """
+    payload = dumps_json(data, indent=indent) + b"\n"
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        stream.write(payload.decode())
+        return
+    # Flush any pending text output so ordering is preserved
+    stream.flush()
+    buffer.write(payload)
+    buffer.flush()
@@ -22,6 +22,7 @@ from .git import (
     get_operation_tier,
     is_agent_mode,
     is_protected_branch,
+    stdin_is_tty,
     validate_conventional_commit,
 )
 
@@ -57,6 +58,7 @@ __all__ = [
     "get_operation_tier",
     "is_agent_mode",
     "is_protected_branch",
+    "stdin_is_tty",
     "validate_conventional_commit",
     # GitHub safety
     "GitHubSafetyConfig",
@@ -7,6 +7,7 @@ Safety Tiers:
 - TIER 4 (PROTECTED): Never allowed (force-push to protected branches)
 """
 
+import functools
 import os
 import re
 from dataclasses import dataclass, field
@@ -153,6 +154,15 @@ OPERATION_TIERS: dict[str, GitSafetyTier] = {
 }
 
 
+@functools.cache
+def stdin_is_tty() -> bool:
+    """Check whether stdin is a terminal.
+
+    Cached: stdin doesn't change for the life of the process.
+    """
+    return os.isatty(0)
+
+
 def is_agent_mode() -> bool:
     """Check if running in agent mode.
 
@@ -231,7 +241,6 @@ def check_git_safety(
         config = DEFAULT_GIT_SAFETY_CONFIG
 
     tier = get_operation_tier(operation)
-    agent_mode = is_agent_mode()
 
     # Tier 1: Read operations always allowed
     if tier == GitSafetyTier.READ:
@@ -240,9 +249,11 @@ def check_git_safety(
     # Tier 2: Write operations require --write flag
     # Auto-imply --write for interactive sessions (human at terminal).
     # Non-interactive contexts (agents, CI, MCP) still require explicit --write.
+    # An explicit --write settles it without probing the tty or environment.
     if tier == GitSafetyTier.WRITE:
-        effective_write = write_flag or (os.isatty(0) and not agent_mode)
-        if not effective_write:
+        if write_flag:
+            return
+        if not (stdin_is_tty() and not is_agent_mode()):
             raise GitSafetyError(
                 f"Operation '{operation}' requires --write flag",
                 tier=tier,
@@ -254,7 +265,7 @@ def check_git_safety(
     # Tier 3: Dangerous operations
     if tier == GitSafetyTier.DANGEROUS:
         # In agent mode, dangerous operations are blocked entirely
-        if agent_mode:
+        if is_agent_mode():
             raise GitSafetyError(
                 f"Operation '{operation}' is blocked in agent mode",
                 tier=tier,
@@ -299,6 +310,27 @@ def check_git_safety(
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _conventional_commit_re(types: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile the conventional commit pattern for a set of types.
+
+    Pattern: type(scope)!?: description
+
+    Types are plain ASCII words, so re.ASCII keeps case-insensitive
+    matching off the Unicode case-folding tables.
+    """
+    return re.compile(
+        r"^(" + "|".join(map(re.escape, types)) + r")(\(.+\))?!?: .+",
+        re.IGNORECASE | re.ASCII,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _issue_pattern_re(pattern: str) -> re.Pattern[str]:
+    """Compile a configured issue pattern once per pattern string."""
+    return re.compile(pattern)
+
+
 def validate_conventional_commit(
     message: str,
     config: Optional[GitSafetyConfig] = None,
@@ -325,17 +357,17 @@ def validate_conventional_commit(
         # Just check it's not empty and has reasonable length
         if not message.strip():
             return (False, "Commit message cannot be empty")
-        if len(message.split("\n")[0]) > 72:
+        if len(message.split("\n", 1)[0]) > 72:
             return (False, "First line should be 72 characters or less")
         return (True, None)
 
     # Conventional commits format
-    # Pattern: type(scope)!?: description
-    pattern = r"^(" + "|".join(config.conventional_types) + r")(\(.+\))?!?: .+"
-
-    first_line = message.split("\n")[0]
+    first_line = message.split("\n", 1)[0]
 
-    if not re.match(pattern, first_line, re.IGNORECASE):
+    # Every valid message has ": " — reject without touching the regex
+    if ": " not in first_line or not _conventional_commit_re(
+        tuple(config.conventional_types)
+    ).match(first_line):
         types_str = ", ".join(config.conventional_types)
         return (
             False,
@@ -413,7 +445,7 @@ def extract_issue_number(
     if not config.auto_link_issues:
         return None
 
-    match = re.search(config.issue_pattern, branch)
+    match = _issue_pattern_re(config.issue_pattern).search(branch)
     if match:
         return int(match.group("num"))
 
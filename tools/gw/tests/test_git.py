@@ -1,6 +1,7 @@
 """Tests for Git integration - wrapper, safety, and commands."""
 
 import os
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -342,6 +343,26 @@ class TestGitWrapper:
         git = Git()
         assert git.is_repo()
 
+    @patch("subprocess.run")
+    def test_is_repo_probes_once(self, mock_run: MagicMock) -> None:
+        """Test the repository probe is cached on the instance."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=".git\ntrue\n")
+        git = Git()
+        assert git.is_repo()
+        assert git.is_repo()
+        assert mock_run.call_count == 1
+        assert git.git_dir == ".git"
+        assert git.is_inside_work_tree
+
+    def test_get_git_memoized_per_cwd(self, tmp_path, monkeypatch) -> None:
+        """Test get_git() reuses one instance per working directory."""
+        from gw.git_wrapper import get_git
+
+        monkeypatch.chdir(tmp_path)
+        git = get_git()
+        assert get_git() is git
+        assert git.working_dir == tmp_path.resolve()
+
     @patch("subprocess.run")
     def test_execute_success(self, mock_run: MagicMock) -> None:
         """Test successful command execution."""
@@ -363,6 +384,147 @@ class TestGitWrapper:
         with pytest.raises(GitError):
             git.execute(["status"])
 
+    @patch("subprocess.run")
+    def test_stash_list(self, mock_run: MagicMock) -> None:
+        """Test stash entries parse from NUL-separated fields."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "stash@{0}\x00On main: my msg\x00"
+                "stash@{1}\x00WIP on main: abc1234 feat: x\x00"
+            ),
+        )
+        git = Git()
+
+        assert git.stash_list() == [
+            {"index": 0, "description": "On main: my msg"},
+            {"index": 1, "description": "WIP on main: abc1234 feat: x"},
+        ]
+
+    @patch("subprocess.run")
+    def test_cat_file_batch_check(self, mock_run: MagicMock) -> None:
+        """Test refs resolve in one cat-file call, missing ones to None."""
+        full = "a" * 40
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=f"{full}\nnope missing\n",
+        )
+        git = Git()
+
+        assert git.cat_file_batch_check(["abc1234", "nope"]) == {
+            "abc1234": full,
+            "nope": None,
+        }
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[1]["input"] == "abc1234\nnope\n"
+
+    @patch("subprocess.run")
+    def test_status_porcelain_raw_returns_bytes(self, mock_run: MagicMock) -> None:
+        """Test raw porcelain status is passed through unparsed."""
+        raw = b"# branch.head main\x00? new file.txt\x00"
+        mock_run.return_value = MagicMock(returncode=0, stdout=raw, stderr=b"")
+        git = Git()
+
+        assert git.status_porcelain_raw() == raw
+        assert "-z" in mock_run.call_args[0][0]
+
+    @patch("subprocess.run")
+    def test_status_porcelain_raw_failure(self, mock_run: MagicMock) -> None:
+        """Test raw porcelain status raises GitError on failure."""
+        mock_run.return_value = MagicMock(
+            returncode=128, stdout=b"", stderr=b"fatal: not a git repository"
+        )
+        git = Git()
+
+        with pytest.raises(GitError) as exc_info:
+            git.status_porcelain_raw()
+        assert exc_info.value.returncode == 128
+
+    @patch("subprocess.run")
+    def test_is_dirty_clean_tree(self, mock_run: MagicMock) -> None:
+        """Test a clean tree needs only the diff and untracked probes."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="")
+        git = Git()
+
+        assert not git.is_dirty()
+        commands = [c[0][0][1] for c in mock_run.call_args_list]
+        assert commands == ["diff-index", "ls-files"]
+
+    @patch("subprocess.run")
+    def test_is_dirty_tracked_changes(self, mock_run: MagicMock) -> None:
+        """Test a failing quiet diff short-circuits as dirty."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "git diff-files")
+        git = Git()
+
+        assert git.is_dirty(include_staged=False)
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[0][0][1] == "diff-files"
+
+    @patch("subprocess.Popen")
+    def test_has_any_change_stops_at_first_byte(self, mock_popen: MagicMock) -> None:
+        """Test the status stream is abandoned as soon as output arrives."""
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout.read.return_value = b"?"
+        git = Git()
+
+        assert git.has_any_change()
+        proc.stdout.read.assert_called_once_with(1)
+        proc.kill.assert_called_once()
+        assert "--no-optional-locks" in mock_popen.call_args[0][0]
+
+    @patch("subprocess.Popen")
+    def test_has_any_change_clean(self, mock_popen: MagicMock) -> None:
+        """Test empty status output means a clean tree."""
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout.read.return_value = b""
+        proc.wait.return_value = 0
+        git = Git()
+
+        assert not git.has_any_change()
+        proc.kill.assert_not_called()
+        assert mock_popen.call_args.kwargs["stderr"] == subprocess.DEVNULL
+
+    @patch("subprocess.run")
+    @patch("subprocess.Popen")
+    def test_has_any_change_error_rerun(self, mock_popen: MagicMock, mock_run: MagicMock) -> None:
+        """Test a failed probe is re-run to surface git's error text."""
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout.read.return_value = b""
+        proc.wait.return_value = 128
+        mock_run.side_effect = subprocess.CalledProcessError(
+            128, ["git", "status"], stderr="fatal: not a git repository"
+        )
+        git = Git()
+
+        with pytest.raises(GitError) as exc_info:
+            git.has_any_change()
+        assert "not a git repository" in exc_info.value.stderr
+
+    @patch("subprocess.run")
+    def test_is_dirty_untracked_only(self, mock_run: MagicMock) -> None:
+        """Test untracked files count as dirty."""
+        mock_run.side_effect = [
+            MagicMock(returncode=0, stdout=""),
+            MagicMock(returncode=0, stdout="new.txt\n"),
+        ]
+        git = Git()
+
+        assert git.is_dirty()
+
+    @patch("subprocess.run")
+    def test_staged_paths(self, mock_run: MagicMock) -> None:
+        """Test staged paths come from diff --cached -z, verbatim."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout="src/a.ts\x00caf\u00e9 notes.md\x00",
+        )
+        git = Git()
+
+        assert git.staged_paths() == ["src/a.ts", "caf\u00e9 notes.md"]
+        assert mock_run.call_args[0][0] == [
+            "git", "diff", "--cached", "--name-only", "-z",
+        ]
+
 
 class TestGitStatusParsing:
     """Tests for git status parsing."""
@@ -372,7 +534,7 @@ class TestGitStatusParsing:
         """Test parsing clean status."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="# branch.head main\n# branch.upstream origin/main\n# branch.ab +0 -0\n",
+            stdout="# branch.head main\0# branch.upstream origin/main\0# branch.ab +0 -0\0",
         )
         git = Git()
         status = git.status()
@@ -389,11 +551,11 @@ class TestGitStatusParsing:
         mock_run.return_value = MagicMock(
             returncode=0,
             stdout=(
-                "# branch.head feature/test\n"
-                "# branch.ab +2 -1\n"
-                "1 M. N... 100644 100644 abc123 def456 src/file.py\n"
-                "1 .M N... 100644 100644 abc123 def456 src/other.py\n"
-                "? untracked.txt\n"
+                "# branch.head feature/test\0"
+                "# branch.ab +2 -1\0"
+                "1 M. N... 100644 100644 100644 abc123 def456 src/file.py\0"
+                "1 .M N... 100644 100644 100644 abc123 def456 src/other.py\0"
+                "? untracked.txt\0"
             ),
         )
         git = Git()
@@ -406,6 +568,27 @@ class TestGitStatusParsing:
         assert len(status.staged) == 1
         assert len(status.unstaged) == 1
         assert len(status.untracked) == 1
+        assert status.dirty_count == 2
+
+    @patch("subprocess.run")
+    def test_parse_status_paths_verbatim(self, mock_run: MagicMock) -> None:
+        """Test -z output keeps spaces in paths and skips rename origins."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "# branch.head main\0"
+                "1 A. N... 000000 100644 100644 000 abc my file.txt\0"
+                "2 R. N... 100644 100644 100644 abc abc R100 new name.py\0old name.py\0"
+                "u UU N... 100644 100644 100644 100644 a b c both mod.txt\0"
+                "? dir with space/\0"
+            ),
+        )
+        git = Git()
+        status = git.status()
+
+        assert status.staged_paths == ["my file.txt", "new name.py"]
+        assert status.unstaged == [("U", "both mod.txt")]
+        assert status.untracked == ["dir with space/"]
 
 
 class TestGitLogParsing:
@@ -430,6 +613,394 @@ class TestGitLogParsing:
         assert commits[0].author == "Author Name"
         assert commits[0].subject == "feat: add feature"
 
+    @patch("subprocess.run")
+    def test_parse_single_commit_rev_list(self, mock_run: MagicMock) -> None:
+        """Test limit=1 uses rev-list and drops its commit header line."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "commit abc123full\n"
+                "abc123full\x00abc123\x00Author Name\x00author@example.com\x00"
+                "2026-02-01T10:00:00\x00fix: patch\x00\x00\x1e\n"
+            ),
+        )
+        git = Git()
+        commits = git.log(limit=1)
+
+        assert mock_run.call_args[0][0][:3] == ["git", "rev-list", "--max-count=1"]
+        assert len(commits) == 1
+        assert commits[0].hash == "abc123full"
+        assert commits[0].subject == "fix: patch"
+        assert commits[0].body == ""
+
+
+class TestGitTags:
+    """Tests for tag listing."""
+
+    @patch("subprocess.run")
+    def test_parse_tags(self, mock_run: MagicMock) -> None:
+        """Test NUL-delimited for-each-ref records, including tabs in subjects."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                b"v1.1.0\x002 days ago\x00Release\twith tab\x00\n"
+                b"v1.0.0\x003 weeks ago\x00\x00\n"
+            ),
+            stderr=b"",
+        )
+        git = Git()
+        tags = git.tags(limit=2)
+
+        assert tags == [
+            {"name": "v1.1.0", "date": "2 days ago", "message": "Release\twith tab"},
+            {"name": "v1.0.0", "date": "3 weeks ago", "message": ""},
+        ]
+        assert "--count=2" in mock_run.call_args[0][0]
+
+    @patch("subprocess.run")
+    def test_delete_tags_single_process(self, mock_run: MagicMock) -> None:
+        """Test several tags are deleted with one git call."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="")
+        git = Git()
+        git.delete_tags(["v1.0.0", "v1.1.0"])
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["git", "tag", "-d", "v1.0.0", "v1.1.0"]
+
+
+class TestGitRemotes:
+    """Tests for remote listing and caching."""
+
+    @patch("subprocess.run")
+    def test_parse_remotes(self, mock_run: MagicMock) -> None:
+        """Test parsing git remote -v output."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "origin\tgit@github.com:org/repo.git (fetch)\n"
+                "origin\tgit@github.com:org/repo.git (push)\n"
+                "upstream\thttps://github.com/up/repo.git (fetch)\n"
+                "upstream\thttps://github.com/up/repo.git (push)\n"
+            ),
+        )
+        git = Git()
+        remotes = git.remotes()
+
+        assert remotes == {
+            "origin": "git@github.com:org/repo.git",
+            "upstream": "https://github.com/up/repo.git",
+        }
+
+    @patch("subprocess.run")
+    def test_remotes_cached_until_modified(self, mock_run: MagicMock) -> None:
+        """Test remotes are cached and invalidated by remote changes."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout="origin\tgit@github.com:org/repo.git (fetch)\n",
+        )
+        git = Git()
+        git.remotes()
+        git.remotes()
+        assert mock_run.call_count == 1
+
+        git.remote_remove("origin")
+        git.remotes()
+        assert mock_run.call_count == 3
+
+
+class TestGitExecuteChain:
+    """Tests for running several git commands in one shell."""
+
+    @patch("subprocess.run")
+    def test_chain_quotes_arguments(self, mock_run: MagicMock) -> None:
+        """Test commands are shell-quoted and joined with &&."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="abc123\n")
+        git = Git()
+        output = git.execute_chain([
+            ["commit", "-m", "fix: it's done; rm -rf /"],
+            ["rev-parse", "HEAD"],
+        ])
+
+        assert output == "abc123\n"
+        script = mock_run.call_args[0][0]
+        assert script == (
+            "git commit -m 'fix: it'\"'\"'s done; rm -rf /' && git rev-parse HEAD"
+        )
+        assert mock_run.call_args[1]["shell"] is True
+
+    @patch("subprocess.run")
+    def test_chain_failure(self, mock_run: MagicMock) -> None:
+        """Test a failing step raises GitError with its stderr."""
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, "git push", stderr="! [rejected] main -> main"
+        )
+        git = Git()
+        with pytest.raises(GitError) as exc_info:
+            git.execute_chain([["push", "origin", "main"]])
+
+        assert "[rejected]" in exc_info.value.stderr
+
+
+class TestFastShortcut:
+    """Tests for the fast shortcut's single-shell chain."""
+
+    @patch("gw.commands.git.shortcuts.use_shell_batch", return_value=True)
+    @patch("gw.commands.git.shortcuts.get_git")
+    def test_staged_count_ignores_hook_output(
+        self, mock_get_git: MagicMock, mock_batch: MagicMock
+    ) -> None:
+        """Test post-commit hook output doesn't inflate the staged file count."""
+        from click.testing import CliRunner
+
+        from gw.commands.git.shortcuts import fast
+
+        commit_hash = "c" * 40
+        git = MagicMock()
+        git.is_repo.return_value = True
+        git.has_any_change.return_value = True
+        git.current_branch.return_value = "feature/x"
+        git.execute_chain.return_value = (
+            "src/a.ts\0my file.md\0"
+            "post-commit: notified\nsecond hook line\n"
+            f"{commit_hash}\n"
+        )
+        mock_get_git.return_value = git
+
+        result = CliRunner().invoke(
+            fast, ["--write", "-m", "fix: it"], obj={"output_json": False}
+        )
+
+        assert result.exit_code == 0
+        assert "Staged 2 file(s)" in result.output
+        assert commit_hash[:8] in result.output
+        assert ["diff", "--cached", "--name-only", "-z"] in git.execute_chain.call_args[0][0]
+
+
+class TestSyncShortcut:
+    """Tests for the sync shortcut's dirty-tree guard."""
+
+    @patch("gw.commands.git.shortcuts.get_git")
+    def test_dirty_tree_never_fetches(self, mock_get_git: MagicMock) -> None:
+        """Test a refused sync touches neither the network nor remote refs."""
+        from click.testing import CliRunner
+
+        from gw.commands.git.shortcuts import sync
+
+        git = MagicMock()
+        git.is_repo.return_value = True
+        git.is_dirty.return_value = True
+        git.status.return_value.dirty_count = 2
+        mock_get_git.return_value = git
+
+        result = CliRunner().invoke(sync, ["--write"], obj={"output_json": False})
+
+        assert result.exit_code == 1
+        assert "Cannot sync" in result.output
+        git.fetch.assert_not_called()
+        git.rebase.assert_not_called()
+
+
+class TestFetchCommand:
+    """Tests for how the fetch command hands remotes to git."""
+
+    @pytest.mark.parametrize("remote", [".", "..", "mirrors"])
+    @patch("gw.commands.git.read.Git")
+    def test_names_pass_through(self, mock_git_class: MagicMock, remote: str) -> None:
+        """Test paths and remote groups reach git instead of being vetted first."""
+        from click.testing import CliRunner
+
+        from gw.commands.git.read import fetch
+
+        git = mock_git_class.return_value
+        git.is_repo.return_value = True
+        git.execute.return_value = ""
+
+        result = CliRunner().invoke(fetch, [remote], obj={"output_json": True})
+
+        assert result.exit_code == 0
+        git.execute.assert_called_once_with(["fetch", remote])
+        git.remotes.assert_not_called()
+
+    @patch("gw.commands.git.read.Git")
+    def test_unknown_remote_reported(self, mock_git_class: MagicMock) -> None:
+        """Test git's "not a git repository" error is reported as an unknown remote."""
+        from click.testing import CliRunner
+
+        from gw.commands.git.read import fetch
+
+        git = mock_git_class.return_value
+        git.is_repo.return_value = True
+        git.remotes.return_value = {"origin": "git@github.com:org/repo.git"}
+        git.execute.side_effect = GitError(
+            "Git command failed: git fetch nosuch",
+            128,
+            "fatal: 'nosuch' does not appear to be a git repository\n"
+            "fatal: Could not read from remote repository.",
+        )
+
+        result = CliRunner().invoke(fetch, ["nosuch"], obj={"output_json": False})
+
+        assert result.exit_code == 1
+        assert "No such remote" in result.output
+
+    @patch("gw.commands.git.read.Git")
+    def test_bad_url_on_existing_remote(self, mock_git_class: MagicMock) -> None:
+        """Test a configured remote with a bad URL reports git's error, not an unknown remote."""
+        from click.testing import CliRunner
+
+        from gw.commands.git.read import fetch
+
+        git = mock_git_class.return_value
+        git.is_repo.return_value = True
+        git.remotes.return_value = {"origin": "/nonexistent/repo"}
+        git.execute.side_effect = GitError(
+            "Git command failed: git fetch origin",
+            128,
+            "fatal: '/nonexistent/repo' does not appear to be a git repository\n"
+            "fatal: Could not read from remote repository.",
+        )
+
+        result = CliRunner().invoke(fetch, ["origin"], obj={"output_json": False})
+
+        assert result.exit_code == 1
+        assert "No such remote" not in result.output
+        assert "Git error" in result.output
+
+
+class TestBranchCommand:
+    """Tests for the branch command's JSON listing."""
+
+    @patch("gw.commands.git.write.get_git")
+    def test_list_json(self, mock_get_git: MagicMock) -> None:
+        """Test local, remote-HEAD and detached entries are named as git shows them."""
+        import json
+
+        from click.testing import CliRunner
+
+        from gw.commands.git.write import branch
+
+        git = MagicMock()
+        git.is_repo.return_value = True
+        git.execute.return_value = (
+            "*\0(HEAD detached at f2156f1)\0f2156f1\n"
+            " \0refs/heads/feature/348-login\0abc1234\n"
+            " \0refs/remotes/origin/HEAD\0def5678\n"
+            " \0refs/remotes/origin/main\0def5678\n"
+        )
+        mock_get_git.return_value = git
+
+        result = CliRunner().invoke(branch, ["--list"], obj={"output_json": True})
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {
+            "branches": [
+                {"name": "(HEAD detached at f2156f1)", "hash": "f2156f1", "current": True},
+                {"name": "feature/348-login", "hash": "abc1234", "current": False},
+                {"name": "remotes/origin/HEAD", "hash": "def5678", "current": False},
+                {"name": "remotes/origin/main", "hash": "def5678", "current": False},
+            ]
+        }
+
+
+class TestCherryPickCommand:
+    """Tests for cherry-pick's single sequencer run."""
+
+    HASH_A = "a" * 40
+    HASH_D = "d" * 40
+
+    def _mock_git(self, cherry_pick_error: Exception | None = None) -> MagicMock:
+        git = MagicMock()
+        git.is_repo.return_value = True
+        # v1.0 is an annotated tag that peels to the same commit as abc1234
+        git.cat_file_batch_check.return_value = {
+            "abc1234^{commit}": self.HASH_A,
+            "v1.0^{commit}": self.HASH_A,
+            "def5678^{commit}": self.HASH_D,
+        }
+
+        def execute(args: list[str]) -> str:
+            if args[0] == "log":
+                return "abc1234\ndef5678\n"
+            if cherry_pick_error is not None:
+                raise cherry_pick_error
+            return ""
+
+        git.execute.side_effect = execute
+        return git
+
+    @patch("gw.commands.git.write.get_git")
+    def test_single_call_with_unique_hashes(self, mock_get_git: MagicMock) -> None:
+        """Test all commits go to one cherry-pick, each commit once and in order."""
+        import json
+
+        from click.testing import CliRunner
+
+        from gw.commands.git.write import cherry_pick
+
+        git = self._mock_git()
+        mock_get_git.return_value = git
+
+        result = CliRunner().invoke(
+            cherry_pick,
+            ["--write", "abc1234", "v1.0", "def5678"],
+            obj={"output_json": True},
+        )
+
+        assert result.exit_code == 0
+        git.cat_file_batch_check.assert_called_once_with(
+            ["abc1234^{commit}", "v1.0^{commit}", "def5678^{commit}"]
+        )
+        cherry_pick_calls = [
+            c.args[0] for c in git.execute.call_args_list if c.args[0][0] == "cherry-pick"
+        ]
+        assert cherry_pick_calls == [["cherry-pick", self.HASH_A, self.HASH_D]]
+        assert json.loads(result.output) == {
+            "cherry_picked": ["abc1234", "def5678"],
+            "count": 2,
+        }
+
+    @patch("gw.commands.git.write.get_git")
+    def test_missing_commit_rejected(self, mock_get_git: MagicMock) -> None:
+        """Test a ref that does not peel to a commit stops before cherry-pick."""
+        from click.testing import CliRunner
+
+        from gw.commands.git.write import cherry_pick
+
+        git = self._mock_git()
+        git.cat_file_batch_check.return_value = {"HEAD:file^{commit}": None}
+        mock_get_git.return_value = git
+
+        result = CliRunner().invoke(
+            cherry_pick, ["--write", "HEAD:file"], obj={"output_json": False}
+        )
+
+        assert result.exit_code == 1
+        assert "Commit not found" in result.output
+        git.execute.assert_not_called()
+
+    @patch("gw.commands.git.write.get_git")
+    def test_conflict_prints_continue_hint(self, mock_get_git: MagicMock) -> None:
+        """Test a conflicting pick explains how to continue or abort."""
+        from click.testing import CliRunner
+
+        from gw.commands.git.write import cherry_pick
+
+        git = self._mock_git(GitError(
+            "Git command failed: git cherry-pick",
+            1,
+            "error: could not apply def5678... fix\n"
+            "CONFLICT (content): Merge conflict in src/app.ts\n",
+        ))
+        mock_get_git.return_value = git
+
+        result = CliRunner().invoke(
+            cherry_pick, ["--write", "abc1234", "def5678"], obj={"output_json": False}
+        )
+
+        assert result.exit_code == 1
+        assert "Cherry-pick conflict" in result.output
+        assert "git cherry-pick --continue" in result.output
+
 
 # ============================================================================
 # Integration Tests (require actual git repo - mark as slow)
@@ -0,0 +1,55 @@
+"""Tests for JSON output helpers."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from gw import json_output
+from gw.json_output import dumps_json, print_json
+
+
+# ============================================================================
+# Serialization Tests
+# ============================================================================
+
+
+class TestDumpsJson:
+    """Tests for dumps_json() serialization."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, use_orjson: bool) -> None:
+        """Test output parses back to the same data with either backend."""
+        if use_orjson and json_output.orjson is None:
+            pytest.skip("orjson not installed")
+
+        data = {"branch": "main", "files": [{"path": "ü.txt", "additions": 3}]}
+        backend = json_output.orjson if use_orjson else None
+        with patch.object(json_output, "orjson", backend):
+            pretty = dumps_json(data)
+            compact = dumps_json(data, indent=False)
+
+        assert isinstance(pretty, bytes)
+        assert json.loads(pretty) == data
+        assert json.loads(compact) == data
+        assert b"\n" in pretty
+        assert b"\n" not in compact
+
+    def test_stdlib_fallback_matches_indent_layout(self) -> None:
+        """Test the stdlib fallback keeps the 2-space layout."""
+        with patch.object(json_output, "orjson", None):
+            output = dumps_json({"a": [1]})
+
+        assert output == b'{\n  "a": [\n    1\n  ]\n}'
+
+
+class TestPrintJson:
+    """Tests for print_json() output."""
+
+    def test_writes_newline_terminated_document(self, capsys) -> None:
+        """Test JSON is written to stdout without Rich markup handling."""
+        print_json({"message": "[red]not markup[/red]"}, indent=False)
+
+        out = capsys.readouterr().out
+        assert out.endswith("\n")
+        assert json.loads(out) == {"message": "[red]not markup[/red]"}
@@ -0,0 +1,156 @@
+"""Tests for git workflow helpers - formattable filter, Prettier, type check."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gw.commands.git.workflows import _check_command, _is_formattable, _run_prettier
+
+
+# ============================================================================
+# Formattable Filter Tests
+# ============================================================================
+
+
+class TestIsFormattable:
+    """Tests for the Prettier extension filter."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "src/app.ts",
+            "package.json",
+            ".prettierrc.json",
+            "packages/ui/Button.svelte",
+            "src/App.TSX",
+            "docs/README.Md",
+        ],
+    )
+    def test_formattable(self, path: str) -> None:
+        """Test known extensions match regardless of case."""
+        assert _is_formattable(path)
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            ".json",
+            "config/.yaml",
+            ".prettierrc",
+            "src/main.py",
+            "assets.json/logo.png",
+            "Makefile",
+        ],
+    )
+    def test_not_formattable(self, path: str) -> None:
+        """Test dotfiles with no stem and other extensions are skipped."""
+        assert not _is_formattable(path)
+
+
+# ============================================================================
+# Type Check Command Tests
+# ============================================================================
+
+
+@pytest.mark.skipif(os.name == "nt", reason="tsc shortcut is POSIX-only")
+class TestCheckCommand:
+    """Tests for choosing between local tsc and pnpm run check."""
+
+    def _install_tsc(self, pkg_path: Path) -> Path:
+        tsc = pkg_path / "node_modules" / ".bin" / "tsc"
+        tsc.parent.mkdir(parents=True)
+        tsc.write_text("")
+        return tsc
+
+    def test_plain_tsc(self, tmp_path: Path) -> None:
+        """Test a bare tsc script runs the local binary."""
+        tsc = self._install_tsc(tmp_path)
+
+        assert _check_command(tmp_path, "tsc") == [str(tsc)]
+
+    def test_tsc_with_project(self, tmp_path: Path) -> None:
+        """Test -p <config> is passed through to tsc."""
+        tsc = self._install_tsc(tmp_path)
+
+        assert _check_command(tmp_path, " tsc -p tsconfig.check.json ") == [
+            str(tsc),
+            "-p",
+            "tsconfig.check.json",
+        ]
+
+    @pytest.mark.parametrize(
+        "script",
+        [
+            "svelte-kit sync && svelte-check --tsconfig ./tsconfig.json",
+            "tsc --noEmit",
+            "tsc -p a.json && eslint .",
+        ],
+    )
+    def test_other_scripts_use_pnpm(self, tmp_path: Path, script: str) -> None:
+        """Test anything beyond tsc [-p cfg] goes through pnpm."""
+        self._install_tsc(tmp_path)
+
+        assert _check_command(tmp_path, script) == ["pnpm", "run", "check"]
+
+    def test_missing_tsc_binary_uses_pnpm(self, tmp_path: Path) -> None:
+        """Test a tsc script without node_modules/.bin/tsc falls back to pnpm."""
+        assert _check_command(tmp_path, "tsc") == ["pnpm", "run", "check"]
+
+
+# ============================================================================
+# Prettier Sharding Tests
+# ============================================================================
+
+
+class TestRunPrettier:
+    """Tests for merging sharded Prettier runs."""
+
+    def _shard(self, returncode: int, out: str = "", err: str = "") -> MagicMock:
+        proc = MagicMock()
+        proc.returncode = returncode
+        proc.communicate.return_value = (out, err)
+        return proc
+
+    @patch("gw.commands.git.workflows.subprocess.run")
+    def test_small_file_list_single_process(self, mock_run: MagicMock) -> None:
+        """Test short file lists skip sharding."""
+        mock_run.return_value = subprocess.CompletedProcess([], 1, "", "")
+
+        result = _run_prettier(["--check"], ["a.ts", "b.ts"], timeout=60)
+
+        assert result.returncode == 1
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["bun", "x", "prettier", "--check", "a.ts", "b.ts"]
+
+    @pytest.mark.parametrize(
+        ("codes", "expected"),
+        [
+            ([0, 0, 0, 0], 0),
+            ([0, 1, 0, 1], 1),
+            ([1, 2, 1, 0], 2),
+            ([2, 1, 0, 0], 2),
+        ],
+    )
+    @patch("gw.commands.git.workflows.os.cpu_count", return_value=4)
+    @patch("gw.commands.git.workflows.subprocess.Popen")
+    def test_most_severe_exit_code(
+        self,
+        mock_popen: MagicMock,
+        mock_cpu_count: MagicMock,
+        codes: list[int],
+        expected: int,
+    ) -> None:
+        """Test errors (2) outrank unformatted files (1), which outrank success."""
+        mock_popen.side_effect = [
+            self._shard(code, f"out{i}\n", f"err{i}\n") for i, code in enumerate(codes)
+        ]
+        files = [f"src/file{i}.ts" for i in range(128)]
+
+        result = _run_prettier(["--check"], files, timeout=60)
+
+        assert mock_popen.call_count == 4
+        assert result.returncode == expected
+        assert result.stdout == "out0\nout1\nout2\nout3\n"
+        assert result.stderr == "err0\nerr1\nerr2\nerr3\n"
@@ -5,9 +5,14 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
+from click.testing import CliRunner
+
 from gw.commands.git.worktree import (
+    worktree_create,
     resolve_ref,
+    resolve_worktree_path,
     get_existing_worktrees,
+    _append_gitignore_entry,
     WORKTREE_DIR,
 )
 from gw.gh_wrapper import GitHubError
@@ -93,6 +98,40 @@ class TestResolveRef:
         assert ref_type == "branch"
 
 
+class TestResolveWorktreePath:
+    """Tests for resolve_worktree_path() function."""
+
+    @patch("gw.commands.git.worktree.GitHub")
+    @patch("gw.commands.git.worktree.get_worktree_base")
+    def test_existing_pr_worktree_skips_github(
+        self, mock_base: MagicMock, mock_gh_class: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test an existing pr-N directory resolves without a GitHub call."""
+        (tmp_path / "pr-920").mkdir()
+        mock_base.return_value = tmp_path
+
+        worktree_name, worktree_path = resolve_worktree_path("920")
+
+        assert worktree_name == "pr-920"
+        assert worktree_path == tmp_path / "pr-920"
+        mock_gh_class.assert_not_called()
+
+    @patch("gw.commands.git.worktree.GitHub")
+    @patch("gw.commands.git.worktree.get_worktree_base")
+    def test_missing_pr_worktree_looks_up_github(
+        self, mock_base: MagicMock, mock_gh_class: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a PR without a local worktree still goes through GitHub."""
+        mock_base.return_value = tmp_path
+        mock_gh_class.return_value.pr_view.return_value.head_branch = "feature/x"
+
+        worktree_name, worktree_path = resolve_worktree_path("920")
+
+        assert worktree_name == "pr-920"
+        assert worktree_path == tmp_path / "pr-920"
+        mock_gh_class.return_value.pr_view.assert_called_once_with(920)
+
+
 # ============================================================================
 # Worktree Parsing Tests
 # ============================================================================
@@ -162,6 +201,24 @@ class TestGetExistingWorktrees:
         assert len(worktrees) == 1
         assert worktrees[0].get("bare") is True
 
+    @patch("subprocess.run")
+    def test_parse_path_with_spaces(self, mock_run: MagicMock) -> None:
+        """Test that only the first space separates key from value."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=(
+                "worktree /path/to/my repo\n"
+                "HEAD abc123\n"
+                "branch refs/heads/fix/refs/heads-cleanup\n"
+                "\n"
+            ),
+        )
+
+        worktrees = get_existing_worktrees()
+
+        assert worktrees[0]["path"] == "/path/to/my repo"
+        assert worktrees[0]["branch"] == "fix/refs/heads-cleanup"
+
     @patch("subprocess.run")
     def test_empty_output(self, mock_run: MagicMock) -> None:
         """Test handling empty output."""
@@ -172,6 +229,44 @@ class TestGetExistingWorktrees:
         assert worktrees == []
 
 
+class TestAppendGitignoreEntry:
+    """Tests for _append_gitignore_entry()."""
+
+    def test_appends_once(self, tmp_path: Path) -> None:
+        """Test the entry is written once and later calls are no-ops."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules\n")
+
+        assert _append_gitignore_entry(gitignore, WORKTREE_DIR) is True
+        assert _append_gitignore_entry(gitignore, WORKTREE_DIR) is False
+
+        content = gitignore.read_text()
+        assert content.startswith("node_modules\n")
+        assert content.count(f"{WORKTREE_DIR}/") == 1
+
+
+class TestWorktreeCreate:
+    """Tests for creating several worktrees at once."""
+
+    def test_name_collision_is_reported(self, tmp_path: Path) -> None:
+        """Test a REF whose dir name is already claimed fails instead of vanishing."""
+        created = {"path": str(tmp_path / "feature-a"), "branch": "feature/a"}
+        with patch("gw.commands.git.worktree.check_git_safety"), \
+             patch("gw.commands.git.worktree.ensure_worktree_dir_exists", return_value=tmp_path), \
+             patch("gw.commands.git.worktree._create_worktree", return_value=created) as create:
+            result = CliRunner().invoke(
+                worktree_create,
+                ["--write", "feature/a", "feature-a", "feature/a"],
+                obj={"output_json": True},
+            )
+
+        assert result.exit_code == 1
+        create.assert_called_once()
+        assert create.call_args.args[0] == "feature/a"
+        assert '"ref":"feature-a"' in result.output
+        assert "already used by feature/a" in result.output
+
+
 # ============================================================================
 # Constants Tests
 # ============================================================================